@@ -8,211 +8,319 @@ and temporal validation issues.
 
 import argparse
 import json
+import re
+import sys
+from dataclasses import dataclass
+from multiprocessing import Pool
 from pathlib import Path
 from datetime import datetime, timedelta
+from itertools import chain
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib parser
+    orjson = None
+
+# Day count in a duration string such as "30 days", "30-day" or "30 business days"
+_DAYS_RE = re.compile(r'(\d+)[\s-]*(?:[a-zA-Z]+\s+)*?days?\b', re.IGNORECASE)
+
+
+# Column types treated as timestamps, and constraints that admit future dates
+_TS_TYPE_RE = re.compile(r'date|timestamp', re.IGNORECASE)
+_FUTURE_DATE_RE = re.compile(r'current_date.*>|>.*current_date', re.IGNORECASE | re.DOTALL)
+
+def _token_alternation(patterns):
+    """Compile snake_case patterns into one regex matching whole name tokens.
+
+    Pattern boundaries must fall on a separator (underscore, space, punctuation)
+    or the string edge, so 'end' matches 'customer_end_date' but not 'legend'.
+    """
+    alternatives = sorted(patterns, key=len, reverse=True)
+    body = '|'.join(re.escape(p).replace('_', r'[_\W]+') for p in alternatives)
+    return re.compile(rf'(?<![^\W_])(?:{body})(?![^\W_])')
+
+@dataclass(slots=True)
+class Finding:
+    """A single leakage risk or warning raised by LeakageRiskChecker."""
+    category: str
+    severity: str
+    issue: str
+    recommendation: str
+    description: str | None = None
+    
+    def to_dict(self):
+        """Return the finding as a JSON-ready dict (description only when set)."""
+        finding = {'category': self.category, 'severity': self.severity, 'issue': self.issue}
+        if self.description is not None:
+            finding['description'] = self.description
+        finding['recommendation'] = self.recommendation
+        return finding
+
+def _finding_to_json(obj):
+    """JSON ``default`` hook serializing Finding records."""
+    if isinstance(obj, Finding):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def load_plan(plan_path):
+    """Load a planning file, parsing with orjson when it is installed."""
+    with open(plan_path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def save_results(results, output_path):
+    """Write analysis results as indented JSON, via orjson when installed."""
+    if orjson:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(results, default=_finding_to_json, option=options))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(results, f, indent=2, default=_finding_to_json)
 
 class LeakageRiskChecker:
     """Analyzer for data leakage risks in DS planning files."""
     
-    LEAKAGE_RISK_KEYWORDS = [
+    LEAKAGE_RISK_KEYWORDS = frozenset({
         'future', 'next', 'after', 'subsequent', 'following',
         'outcome', 'result', 'resolution', 'final', 'end',
         'completion', 'cancellation', 'churn', 'conversion'
-    ]
+    })
     
-    HIGH_RISK_FEATURES = [
+    HIGH_RISK_FEATURES = frozenset({
         'resolution_time', 'days_to_resolve', 'time_to_complete',
         'final_status', 'end_date', 'completion_date',
         'cancellation_date', 'churn_date', 'conversion_date'
-    ]
+    })
+    
+    # Compiled once at import; each scans a lowercased feature name in one pass
+    _HIGH_RISK_RE = _token_alternation(HIGH_RISK_FEATURES)
+    _KEYWORD_RE = _token_alternation(LEAKAGE_RISK_KEYWORDS)
     
     def __init__(self, plan_data):
         self.plan = plan_data
-        self.risks = []
-        self.warnings = []
         
-    def check_temporal_validation(self):
+    @classmethod
+    def check_temporal_validation(cls, plan):
         """Check if temporal validation is properly configured."""
-        eval_protocol = self.plan.get('evaluation_protocol', {})
-        temporal_val = eval_protocol.get('temporal_validation', {})
+        risks, warnings = [], []
+        try:
+            temporal_val = plan['evaluation_protocol']['temporal_validation']
+        except KeyError:
+            temporal_val = None
         
         if not temporal_val:
-            self.risks.append({
-                'category': 'temporal_validation',
-                'severity': 'high',
-                'issue': 'No temporal validation specified',
-                'description': 'Temporal validation is critical for preventing leakage in time-series problems',
-                'recommendation': 'Add temporal_validation section with training/validation periods'
-            })
-            return
+            risks.append(Finding(
+                category='temporal_validation',
+                severity='high',
+                issue='No temporal validation specified',
+                description='Temporal validation is critical for preventing leakage in time-series problems',
+                recommendation='Add temporal_validation section with training/validation periods'
+            ))
+            return risks, warnings
         
         # Check for minimum gap
         min_gap = temporal_val.get('minimum_gap')
         prediction_horizon = temporal_val.get('prediction_horizon')
         
         if not min_gap:
-            self.warnings.append({
-                'category': 'temporal_validation', 
-                'severity': 'medium',
-                'issue': 'No minimum gap specified between training and prediction',
-                'recommendation': 'Consider adding minimum gap to prevent temporal leakage'
-            })
+            warnings.append(Finding(
+                category='temporal_validation', 
+                severity='medium',
+                issue='No minimum gap specified between training and prediction',
+                recommendation='Consider adding minimum gap to prevent temporal leakage'
+            ))
         
         # Check if gap is reasonable for prediction horizon
         if min_gap and prediction_horizon:
             try:
-                # Simple check - gap should be at least as long as prediction horizon
-                if 'day' in min_gap.lower() and 'day' in prediction_horizon.lower():
-                    gap_days = int(''.join(filter(str.isdigit, min_gap)))
-                    horizon_days = int(''.join(filter(str.isdigit, prediction_horizon)))
-                    
-                    if gap_days < horizon_days:
-                        self.warnings.append({
-                            'category': 'temporal_validation',
-                            'severity': 'medium', 
-                            'issue': f'Minimum gap ({gap_days}d) shorter than prediction horizon ({horizon_days}d)',
-                            'recommendation': 'Consider increasing minimum gap to match or exceed prediction horizon'
-                        })
-            except (ValueError, AttributeError):
-                pass  # Skip parsing if format is unexpected
+                gap_match = _DAYS_RE.search(min_gap)
+                horizon_match = _DAYS_RE.search(prediction_horizon)
+            except TypeError:
+                gap_match = horizon_match = None  # Skip parsing if format is unexpected
+            
+            # Simple check - gap should be at least as long as prediction horizon
+            if gap_match and horizon_match:
+                gap_days = int(gap_match.group(1))
+                horizon_days = int(horizon_match.group(1))
+                
+                if gap_days < horizon_days:
+                    warnings.append(Finding(
+                        category='temporal_validation',
+                        severity='medium', 
+                        issue=f'Minimum gap ({gap_days}d) shorter than prediction horizon ({horizon_days}d)',
+                        recommendation='Consider increasing minimum gap to match or exceed prediction horizon'
+                    ))
+        
+        return risks, warnings
     
-    def check_feature_engineering(self):
+    @classmethod
+    def check_feature_engineering(cls, plan):
         """Check feature engineering for leakage risks."""
-        feature_eng = self.plan.get('feature_engineering', {})
+        risks, warnings = [], []
+        feature_eng = plan.get('feature_engineering', {})
         leakage_prevention = feature_eng.get('leakage_prevention', {})
         
         if not leakage_prevention:
-            self.risks.append({
-                'category': 'feature_engineering',
-                'severity': 'high',
-                'issue': 'No leakage prevention measures specified',
-                'description': 'Feature engineering without leakage prevention is high risk',
-                'recommendation': 'Add leakage_prevention section with validation tests'
-            })
-            return
+            risks.append(Finding(
+                category='feature_engineering',
+                severity='high',
+                issue='No leakage prevention measures specified',
+                description='Feature engineering without leakage prevention is high risk',
+                recommendation='Add leakage_prevention section with validation tests'
+            ))
+            return risks, warnings
         
         # Check for prediction cutoff
         cutoff = leakage_prevention.get('prediction_cutoff')
         if not cutoff:
-            self.risks.append({
-                'category': 'feature_engineering',
-                'severity': 'high',
-                'issue': 'No prediction cutoff defined',
-                'recommendation': 'Define strict temporal boundary for feature engineering'
-            })
+            risks.append(Finding(
+                category='feature_engineering',
+                severity='high',
+                issue='No prediction cutoff defined',
+                recommendation='Define strict temporal boundary for feature engineering'
+            ))
         
         # Check for future information checks
         future_checks = leakage_prevention.get('future_information_checks', [])
         if not future_checks:
-            self.warnings.append({
-                'category': 'feature_engineering',
-                'severity': 'medium',
-                'issue': 'No explicit future information checks listed',
-                'recommendation': 'Document specific checks for preventing future information usage'
-            })
+            warnings.append(Finding(
+                category='feature_engineering',
+                severity='medium',
+                issue='No explicit future information checks listed',
+                recommendation='Document specific checks for preventing future information usage'
+            ))
         
         # Check feature categories for risky patterns
         feature_categories = feature_eng.get('feature_categories', [])
-        for category in feature_categories:
-            features = category.get('features', [])
-            for feature in features:
-                # Check for high-risk feature names
-                for risk_pattern in self.HIGH_RISK_FEATURES:
-                    if risk_pattern in feature.lower():
-                        self.risks.append({
-                            'category': 'feature_engineering',
-                            'severity': 'high',
-                            'issue': f'High-risk feature detected: {feature}',
-                            'description': f'Feature name suggests potential future information usage',
-                            'recommendation': f'Verify that {feature} does not contain future information'
-                        })
-                
-                # Check for leakage keywords in feature names
-                for keyword in self.LEAKAGE_RISK_KEYWORDS:
-                    if keyword in feature.lower():
-                        self.warnings.append({
-                            'category': 'feature_engineering',
-                            'severity': 'medium',
-                            'issue': f'Feature with leakage keyword: {feature} (contains "{keyword}")',
-                            'recommendation': f'Review {feature} for potential temporal issues'
-                        })
+        features = chain.from_iterable(category.get('features', ()) for category in feature_categories)
+        # Normalize every name once: match on the lowered form, report the original
+        normalized = [(feature, feature.lower()) for feature in features]
+        for feature, feature_lower in normalized:
+            # Check for high-risk feature names
+            if cls._HIGH_RISK_RE.search(feature_lower):
+                risks.append(Finding(
+                    category='feature_engineering',
+                    severity='high',
+                    issue=f'High-risk feature detected: {feature}',
+                    description=f'Feature name suggests potential future information usage',
+                    recommendation=f'Verify that {feature} does not contain future information'
+                ))
+                # The high risk already blocks this feature; keyword warnings add nothing
+                continue
+            
+            # Check for leakage keywords in feature names
+            for keyword in dict.fromkeys(cls._KEYWORD_RE.findall(feature_lower)):
+                warnings.append(Finding(
+                    category='feature_engineering',
+                    severity='medium',
+                    issue=f'Feature with leakage keyword: {feature} (contains "{keyword}")',
+                    recommendation=f'Review {feature} for potential temporal issues'
+                ))
+        
+        return risks, warnings
     
-    def check_data_contracts(self):
+    @classmethod
+    def check_data_contracts(cls, plan):
         """Check data contracts for temporal consistency."""
-        data_contracts = self.plan.get('data_contracts', [])
+        risks, warnings = [], []
+        data_contracts = plan.get('data_contracts', [])
         
         for contract in data_contracts:
             schema = contract.get('schema', {})
             columns = schema.get('columns', [])
             
             # Look for timestamp columns and their constraints
-            timestamp_cols = [col for col in columns if 'date' in col.get('type', '').lower() or 'timestamp' in col.get('type', '').lower()]
+            timestamp_cols = [col for col in columns if _TS_TYPE_RE.search(col.get('type', ''))]
             
             for col in timestamp_cols:
                 constraints = col.get('constraints', [])
                 
                 # Check for future date constraints
                 for constraint in constraints:
-                    if 'current_date' in constraint.lower() and '>' in constraint:
-                        self.risks.append({
-                            'category': 'data_contracts',
-                            'severity': 'high', 
-                            'issue': f'Future date allowed in {col["name"]}: {constraint}',
-                            'recommendation': 'Ensure timestamp constraints prevent future dates'
-                        })
+                    if _FUTURE_DATE_RE.search(constraint):
+                        risks.append(Finding(
+                            category='data_contracts',
+                            severity='high', 
+                            issue=f'Future date allowed in {col["name"]}: {constraint}',
+                            recommendation='Ensure timestamp constraints prevent future dates'
+                        ))
+        
+        return risks, warnings
     
-    def check_evaluation_protocol(self):
+    @classmethod
+    def check_evaluation_protocol(cls, plan):
         """Check evaluation protocol for robust validation."""
-        eval_protocol = self.plan.get('evaluation_protocol', {})
+        risks, warnings = [], []
+        eval_protocol = plan.get('evaluation_protocol', {})
         
         # Check validation strategy
         validation_strategy = eval_protocol.get('validation_strategy')
         if validation_strategy == 'cross_validation':
             # Cross-validation can be risky for time series
-            self.warnings.append({
-                'category': 'evaluation_protocol',
-                'severity': 'medium',
-                'issue': 'Cross-validation used - may not be appropriate for time series',
-                'recommendation': 'Consider temporal_split for time-dependent data'
-            })
+            warnings.append(Finding(
+                category='evaluation_protocol',
+                severity='medium',
+                issue='Cross-validation used - may not be appropriate for time series',
+                recommendation='Consider temporal_split for time-dependent data'
+            ))
         
         # Check for baseline
         baseline = eval_protocol.get('baseline')
         if not baseline:
-            self.warnings.append({
-                'category': 'evaluation_protocol',
-                'severity': 'medium', 
-                'issue': 'No baseline defined',
-                'recommendation': 'Define simple baseline for model comparison'
-            })
+            warnings.append(Finding(
+                category='evaluation_protocol',
+                severity='medium', 
+                issue='No baseline defined',
+                recommendation='Define simple baseline for model comparison'
+            ))
         
         # Check success criteria
         success_criteria = eval_protocol.get('success_criteria', {})
         if not success_criteria.get('statistical_significance'):
-            self.warnings.append({
-                'category': 'evaluation_protocol',
-                'severity': 'medium',
-                'issue': 'No statistical significance testing specified', 
-                'recommendation': 'Add statistical significance requirements'
-            })
+            warnings.append(Finding(
+                category='evaluation_protocol',
+                severity='medium',
+                issue='No statistical significance testing specified', 
+                recommendation='Add statistical significance requirements'
+            ))
+        
+        return risks, warnings
     
-    def analyze(self):
-        """Run comprehensive leakage risk analysis."""
-        self.check_temporal_validation()
-        self.check_feature_engineering()
-        self.check_data_contracts()
-        self.check_evaluation_protocol()
+    @classmethod
+    def analyze_plan(cls, plan):
+        """Run comprehensive leakage risk analysis on a parsed plan.
+
+        The checker holds no per-plan state, so one class can scan any
+        number of plans without setup.
+        """
+        checks = [cls.check_temporal_validation, cls.check_feature_engineering]
+        # A plan without data contracts has nothing for that checker to flag
+        if 'data_contracts' in plan:
+            checks.append(cls.check_data_contracts)
+        checks.append(cls.check_evaluation_protocol)
+        
+        risks, warnings = [], []
+        for check in checks:
+            check_risks, check_warnings = check(plan)
+            risks.extend(check_risks)
+            warnings.extend(check_warnings)
         
         return {
-            'risks': self.risks,
-            'warnings': self.warnings,
-            'risk_score': self._calculate_risk_score()
+            'risks': risks,
+            'warnings': warnings,
+            'risk_score': cls._calculate_risk_score(risks, warnings)
         }
     
-    def _calculate_risk_score(self):
+    def analyze(self):
+        """Run comprehensive leakage risk analysis."""
+        return self.analyze_plan(self.plan)
+    
+    @staticmethod
+    def _calculate_risk_score(risks, warnings):
         """Calculate overall risk score."""
-        high_risk_count = len([r for r in self.risks if r['severity'] == 'high'])
-        medium_risk_count = len([r for r in self.risks + self.warnings if r['severity'] == 'medium'])
+        high_risk_count = sum(1 for r in risks if r.severity == 'high')
+        medium_risk_count = sum(1 for r in chain(risks, warnings) if r.severity == 'medium')
         
         # Risk score from 0-100
         risk_score = min(100, (high_risk_count * 30) + (medium_risk_count * 10))
@@ -224,15 +332,57 @@ class LeakageRiskChecker:
         else:
             return {'score': risk_score, 'level': 'LOW', 'action': 'PROCEED_WITH_CAUTION'}
 
+def _analyze_one(plan_path):
+    """Load and analyze one planning file (module-level so Pool can pickle it)."""
+    plan_data = load_plan(plan_path)
+    return plan_data.get('task_name', 'Unknown'), LeakageRiskChecker.analyze_plan(plan_data)
+
+def format_report(task_name, results, verbose=False):
+    """Render analysis results as console report lines."""
+    risk_score = results['risk_score']
+    out = [
+        f"\n🔍 Leakage Risk Analysis for: {task_name}",
+        f"📊 Risk Score: {risk_score['score']}/100 ({risk_score['level']})",
+        f"🎯 Action: {risk_score['action']}",
+    ]
+    
+    # Display risks
+    if results['risks']:
+        out.append(f"\n⚠️  HIGH RISKS IDENTIFIED ({len(results['risks'])}):")
+        for i, risk in enumerate(results['risks'], 1):
+            out.append(f"\n{i}. {risk.issue}")
+            if verbose:
+                out.append(f"   Category: {risk.category}")
+                out.append(f"   Description: {risk.description or 'N/A'}")
+            out.append(f"   💡 Recommendation: {risk.recommendation}")
+    
+    # Display warnings
+    if results['warnings']:
+        out.append(f"\n⚡ WARNINGS ({len(results['warnings'])}):")
+        for i, warning in enumerate(results['warnings'], 1):
+            out.append(f"\n{i}. {warning.issue}")
+            if verbose:
+                out.append(f"   Category: {warning.category}")
+            out.append(f"   💡 Recommendation: {warning.recommendation}")
+    
+    if not results['risks'] and not results['warnings']:
+        out.append(f"\n✅ No significant leakage risks detected!")
+    
+    return out
+
 def main():
     parser = argparse.ArgumentParser(
         description='Check DS planning files for data leakage risks'
     )
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
         '--plan',
-        required=True,
         help='Path to DS planning file (JSON)'
     )
+    source.add_argument(
+        '--plan-dir',
+        help='Directory of DS planning files (*.json) to check in parallel'
+    )
     parser.add_argument(
         '--step',
         type=int,
@@ -247,59 +397,52 @@ def main():
         action='store_true',
         help='Verbose output with details'
     )
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Skip the console report; only the exit code and --output file are produced'
+    )
     
     args = parser.parse_args()
     
     try:
-        # Load planning file
-        with open(args.plan, 'r') as f:
-            plan_data = json.load(f)
-        
-        # Run analysis
-        checker = LeakageRiskChecker(plan_data)
-        results = checker.analyze()
-        
-        # Display results
-        risk_score = results['risk_score']
-        print(f"\n🔍 Leakage Risk Analysis for: {plan_data.get('task_name', 'Unknown')}")
-        print(f"📊 Risk Score: {risk_score['score']}/100 ({risk_score['level']})")
-        print(f"🎯 Action: {risk_score['action']}")
-        
-        # Display risks
-        if results['risks']:
-            print(f"\n⚠️  HIGH RISKS IDENTIFIED ({len(results['risks'])}):")
-            for i, risk in enumerate(results['risks'], 1):
-                print(f"\n{i}. {risk['issue']}")
-                if args.verbose:
-                    print(f"   Category: {risk['category']}")
-                    print(f"   Description: {risk.get('description', 'N/A')}")
-                print(f"   💡 Recommendation: {risk['recommendation']}")
-        
-        # Display warnings
-        if results['warnings']:
-            print(f"\n⚡ WARNINGS ({len(results['warnings'])}):")
-            for i, warning in enumerate(results['warnings'], 1):
-                print(f"\n{i}. {warning['issue']}")
-                if args.verbose:
-                    print(f"   Category: {warning['category']}")
-                print(f"   💡 Recommendation: {warning['recommendation']}")
-        
-        if not results['risks'] and not results['warnings']:
-            print(f"\n✅ No significant leakage risks detected!")
+        if args.plan_dir:
+            # Analyze every plan in the directory across worker processes
+            plan_paths = sorted(Path(args.plan_dir).glob('*.json'))
+            if not plan_paths:
+                print(f"❌ No planning files (*.json) found in: {args.plan_dir}")
+                return 1
+            with Pool() as pool:
+                analyses = pool.map(_analyze_one, plan_paths)
+            results = {str(path): result for path, (_, result) in zip(plan_paths, analyses)}
+            
+            out = []
+            for task_name, result in analyses:
+                out.extend(format_report(task_name, result, args.verbose))
+            high_count = sum(1 for _, result in analyses if result['risk_score']['level'] == 'HIGH')
+            out.append(f"\n📋 Checked {len(analyses)} plans: {high_count} at HIGH risk")
+        else:
+            # Load and analyze a single planning file
+            task_name, results = _analyze_one(args.plan)
+            out = format_report(task_name, results, args.verbose)
+            high_count = int(results['risk_score']['level'] == 'HIGH')
         
         # Save results if requested
         if args.output:
             output_path = Path(args.output)
-            with open(output_path, 'w') as f:
-                json.dump(results, f, indent=2)
-            print(f"\n📄 Results saved to: {output_path}")
+            save_results(results, output_path)
+            out.append(f"\n📄 Results saved to: {output_path}")
+        
+        # Emit the report in a single write
+        if not args.quiet:
+            sys.stdout.write('\n'.join(out) + '\n')
         
         # Exit with error code if high risks
-        return 1 if risk_score['level'] == 'HIGH' else 0
+        return 1 if high_count else 0
         
     except Exception as e:
         print(f"❌ Error analyzing leakage risks: {e}")
         return 1
 
 if __name__ == '__main__':
-    exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -7,13 +7,24 @@ and business requirements.
 """
 
 import argparse
+import copy
 import json
 import os
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
-def load_template(complexity_level):
-    """Load the appropriate DS planning template."""
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib parser
+    orjson = None
+
+# Separators replaced with '-' in generated plan filenames
+_FILENAME_TABLE = str.maketrans({' ': '-', '_': '-'})
+
+@lru_cache(maxsize=4)
+def _load_template_raw(complexity_level):
+    """Read and parse a DS planning template (cached per complexity level)."""
     template_map = {
         'simple': 'simple-ds-project.json',
         'moderate': 'moderate-ds-project.json', 
@@ -31,14 +42,25 @@ def load_template(complexity_level):
         # Fall back to moderate template if specific template doesn't exist
         template_path = Path(__file__).parent.parent / 'templates' / 'moderate-ds-project.json'
     
-    with open(template_path, 'r') as f:
-        return json.load(f)
+    with open(template_path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def load_template(complexity_level):
+    """Load the appropriate DS planning template.
+
+    Returns a fresh copy so callers can customize it without touching the cache.
+    """
+    return copy.deepcopy(_load_template_raw(complexity_level))
+
+def customize_template(template, task_name, description, now=None):
+    """Customize template with user inputs.
 
-def customize_template(template, task_name, description):
-    """Customize template with user inputs."""
+    Pass ``now`` to stamp several plans with one shared creation time.
+    """
     template['task_name'] = task_name
     template['description'] = description
-    template['creation_date'] = datetime.now().isoformat()
+    template['creation_date'] = (now or datetime.now()).isoformat()
     template['creation_tool'] = 'create_ds_plan.py'
     
     return template
@@ -46,15 +68,19 @@ def customize_template(template, task_name, description):
 def generate_plan_filename(task_name):
     """Generate standardized filename for plan."""
     # Clean task name and create filename
-    clean_name = task_name.lower().replace(' ', '-').replace('_', '-')
+    clean_name = task_name.lower().translate(_FILENAME_TABLE)
     return f"plan-ds-{clean_name}.json"
 
 def save_plan(plan, filename, output_dir='.'):
     """Save the planning file."""
     output_path = Path(output_dir) / filename
     
-    with open(output_path, 'w') as f:
-        json.dump(plan, f, indent=2)
+    if orjson:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(plan, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(plan, f, indent=2)
     
     return output_path
 
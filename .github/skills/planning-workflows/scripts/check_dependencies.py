@@ -8,27 +8,57 @@ planning files, helping identify bottlenecks and parallel execution opportunitie
 Usage: python check_dependencies.py <plan_file.json> [options]
 """
 
+import io
 import json
 import sys
 import os
 import argparse
-from typing import Dict, List, Set, Any, Tuple
+import re
+from typing import Dict, List, Set, Any, Tuple, Optional
 from collections import defaultdict, deque
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib parser
+    orjson = None
+
+_DIGITS_RE = re.compile(r'(\d+)')
+
+def parse_duration_days(time_est: str) -> int:
+    """Estimate a step duration in days from its estimated_time string."""
+    # Simple parsing for day estimation; the last number is the upper bound
+    numbers = _DIGITS_RE.findall(time_est)
+    time_lower = time_est.lower()
+    if 'week' in time_lower:
+        return int(numbers[-1]) * 7 if numbers else 7
+    elif 'month' in time_lower:
+        return int(numbers[-1]) * 30 if numbers else 30
+    else:
+        return int(numbers[-1]) if numbers else 1
+
 class DependencyAnalyzer:
     def __init__(self, plan_file: str):
         self.plan_file = plan_file
         self.plan_data = None
         self.steps = []
+        self.steps_by_id = {}
         self.dependency_graph = {}
         self.reverse_graph = {}
+        self.edge_count = 0
+        self.has_cycle = False
+        self.issue_count = 0
+        self.cycle_nodes = []
+        self._cached_levels = None
+        self._cached_workload = None
         
     def load_plan(self) -> bool:
         """Load the planning file."""
         try:
-            with open(self.plan_file, 'r', encoding='utf-8') as f:
-                self.plan_data = json.load(f)
+            with open(self.plan_file, 'rb') as f:
+                raw = f.read()
+            self.plan_data = orjson.loads(raw) if orjson else json.loads(raw)
             self.steps = self.plan_data.get('steps', [])
+            self._cached_workload = None
             return True
         except Exception as e:
             print(f"Error loading plan: {e}")
@@ -36,9 +66,13 @@ class DependencyAnalyzer:
     
     def build_dependency_graph(self):
         """Build dependency graphs for analysis."""
-        # Reset graphs
+        # Reset graphs and anything derived from them
         self.dependency_graph = {}
-        self.reverse_graph = {}
+        self.reverse_graph = defaultdict(list)
+        self.edge_count = 0
+        self.has_cycle = False
+        self.cycle_nodes = []
+        self._cached_levels = None
         
         # Build forward and reverse dependency graphs
         for step in self.steps:
@@ -46,109 +80,108 @@ class DependencyAnalyzer:
             dependencies = step.get('dependencies', [])
             
             self.dependency_graph[step_id] = dependencies
+            self.edge_count += len(dependencies)
             
             # Build reverse graph (what depends on this step)
-            if step_id not in self.reverse_graph:
-                self.reverse_graph[step_id] = []
-            
+            self.reverse_graph.setdefault(step_id, [])
             for dep in dependencies:
-                if dep not in self.reverse_graph:
-                    self.reverse_graph[dep] = []
                 self.reverse_graph[dep].append(step_id)
+        
+        # Index steps by id for O(1) lookups
+        self.steps_by_id = {step['id']: step for step in self.steps}
     
     def topological_sort(self) -> List[List[int]]:
-        """Return steps grouped by execution level (parallel groups)."""
+        """Return steps grouped by execution level (parallel groups).
+        
+        The levels are computed once per dependency graph and shared by every
+        analysis in the report; callers must not mutate them. Steps that sit
+        in or behind a dependency cycle are left out of the levels and
+        recorded in ``cycle_nodes`` (with ``has_cycle`` set).
+        """
+        if self._cached_levels is not None:
+            return self._cached_levels
+        
+        # Only dependencies on steps in the plan can ever be satisfied
         in_degree = {}
-        for step_id in self.dependency_graph:
-            in_degree[step_id] = len(self.dependency_graph[step_id])
+        for step_id, dependencies in self.dependency_graph.items():
+            in_degree[step_id] = sum(1 for dep in dependencies if dep in self.dependency_graph)
         
+        # Kahn's algorithm, draining the ready queue one level at a time;
+        # steps within a level keep their plan order
+        plan_order = {step_id: i for i, step_id in enumerate(self.dependency_graph)}
         levels = []
-        remaining_nodes = set(self.dependency_graph.keys())
+        queue = deque(node for node, degree in in_degree.items() if degree == 0)
         
-        while remaining_nodes:
-            # Find all nodes with no dependencies (in_degree = 0)
-            current_level = [node for node in remaining_nodes if in_degree[node] == 0]
-            
-            if not current_level:
-                # Circular dependency detected
-                break
-            
+        processed = 0
+        
+        while queue:
+            current_level = sorted((queue.popleft() for _ in range(len(queue))), key=plan_order.__getitem__)
             levels.append(current_level)
-            remaining_nodes -= set(current_level)
+            processed += len(current_level)
             
-            # Update in_degree for remaining nodes
+            # Release dependents whose last dependency just finished
             for node in current_level:
                 for dependent in self.reverse_graph.get(node, []):
-                    if dependent in remaining_nodes:
-                        in_degree[dependent] -= 1
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        queue.append(dependent)
+        
+        # Whatever Kahn could not release is blocked by a circular dependency
+        self.has_cycle = processed < len(in_degree)
+        self.cycle_nodes = [node for node, degree in in_degree.items() if degree > 0]
         
+        self._cached_levels = levels
         return levels
     
     def find_critical_path(self) -> Tuple[List[int], int]:
         """Find the critical path (longest dependency chain)."""
-        def get_step_duration_days(step_id: int) -> int:
-            """Estimate step duration in days."""
-            step = next((s for s in self.steps if s['id'] == step_id), None)
-            if not step:
-                return 1
-            
-            time_est = step.get('estimated_time', '1 day')
-            
-            # Simple parsing for day estimation
-            import re
-            if 'week' in time_est.lower():
-                weeks = re.findall(r'(\d+)', time_est)
-                return int(weeks[-1]) * 7 if weeks else 7
-            elif 'month' in time_est.lower():
-                months = re.findall(r'(\d+)', time_est)
-                return int(months[-1]) * 30 if months else 30
-            else:
-                days = re.findall(r'(\d+)', time_est)
-                return int(days[-1]) if days else 1
-        
-        # Calculate longest path using DFS with memoization
-        memo = {}
-        
-        def longest_path_from(node: int) -> Tuple[int, List[int]]:
-            if node in memo:
-                return memo[node]
-            
-            node_duration = get_step_duration_days(node)
-            dependents = self.reverse_graph.get(node, [])
-            
-            if not dependents:
-                # Leaf node
-                memo[node] = (node_duration, [node])
-                return memo[node]
-            
+        # Parse every step's duration once up front
+        durations = {
+            step['id']: parse_duration_days(step.get('estimated_time', '1 day'))
+            for step in self.steps
+        }
+        
+        # Longest path as a DP over the DAG: walk steps in reverse topological
+        # order so each step's dependents are resolved before the step itself
+        order = [node for level in self.topological_sort() for node in level]
+        longest = {}
+        next_on_path = {}
+        
+        for node in reversed(order):
             max_path_length = 0
-            max_path = []
-            
-            for dependent in dependents:
-                dep_length, dep_path = longest_path_from(dependent)
+            max_next = None
+            for dependent in self.reverse_graph.get(node, []):
+                dep_length = longest.get(dependent, 0)
                 if dep_length > max_path_length:
                     max_path_length = dep_length
-                    max_path = dep_path
+                    max_next = dependent
             
-            total_length = node_duration + max_path_length
-            total_path = [node] + max_path
-            memo[node] = (total_length, total_path)
-            return memo[node]
+            longest[node] = durations.get(node, 1) + max_path_length
+            next_on_path[node] = max_next
         
-        # Find the critical path starting from any node
+        # The critical path starts at the step with the longest chain
         max_length = 0
-        critical_path = []
+        start = None
         
         for step_id in self.dependency_graph.keys():
-            length, path = longest_path_from(step_id)
+            length = longest.get(step_id, 0)
             if length > max_length:
                 max_length = length
-                critical_path = path
+                start = step_id
+        
+        critical_path = []
+        while start is not None:
+            critical_path.append(start)
+            start = next_on_path[start]
         
         return critical_path, max_length
     
-    def analyze_parallelization(self) -> Dict[str, Any]:
-        """Analyze parallelization opportunities."""
+    def analyze_parallelization(self, bottleneck_limit: Optional[int] = None) -> Dict[str, Any]:
+        """Analyze parallelization opportunities.
+        
+        ``bottleneck_limit`` caps how many bottleneck entries are built;
+        ``bottleneck_count`` always holds the full count.
+        """
         levels = self.topological_sort()
         
         analysis = {
@@ -157,6 +190,7 @@ class DependencyAnalyzer:
             'max_parallel_steps': max(len(level) for level in levels) if levels else 0,
             'parallelization_factor': 0,
             'bottlenecks': [],
+            'bottleneck_count': 0,
             'parallel_opportunities': []
         }
         
@@ -169,8 +203,11 @@ class DependencyAnalyzer:
         for i, level in enumerate(levels):
             if len(level) == 1:
                 step_id = level[0]
-                step = next((s for s in self.steps if s['id'] == step_id), None)
+                step = self.steps_by_id.get(step_id)
                 if step:
+                    analysis['bottleneck_count'] += 1
+                    if bottleneck_limit is not None and len(analysis['bottlenecks']) >= bottleneck_limit:
+                        continue
                     analysis['bottlenecks'].append({
                         'level': i + 1,
                         'step_id': step_id,
@@ -190,7 +227,10 @@ class DependencyAnalyzer:
         return analysis
     
     def analyze_agent_workload(self) -> Dict[str, Any]:
-        """Analyze workload distribution across agents."""
+        """Analyze workload distribution across agents (cached per loaded plan)."""
+        if self._cached_workload is not None:
+            return self._cached_workload
+        
         agent_workload = defaultdict(list)
         
         for step in self.steps:
@@ -207,7 +247,7 @@ class DependencyAnalyzer:
         max_workload = max(step_counts) if step_counts else 0
         min_workload = min(step_counts) if step_counts else 0
         
-        return {
+        self._cached_workload = {
             'agent_distribution': dict(agent_workload),
             'workload_balance': {
                 'average': round(avg_workload, 1),
@@ -216,32 +256,43 @@ class DependencyAnalyzer:
                 'balance_ratio': round(max_workload / avg_workload, 2) if avg_workload > 0 else 0
             }
         }
+        return self._cached_workload
     
-    def find_potential_deadlocks(self) -> List[Dict[str, Any]]:
-        """Find potential issues in the dependency structure."""
+    def find_potential_deadlocks(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Find potential issues in the dependency structure.
+        
+        At most ``limit`` issues are built when given; ``self.issue_count``
+        always holds the full count.
+        """
         issues = []
+        self.issue_count = 0
         
         # Check for orphaned steps (steps with no dependents and non-final)
         levels = self.topological_sort()
         if levels:
             final_level_steps = set(levels[-1])
             
-            for step_id, dependents in self.reverse_graph.items():
-                if not dependents and step_id not in final_level_steps:
-                    step = next((s for s in self.steps if s['id'] == step_id), None)
-                    if step:
-                        issues.append({
-                            'type': 'orphaned_step',
-                            'step_id': step_id,
-                            'description': f"Step {step_id} has no dependents but is not final",
-                            'agent': step.get('agent'),
-                            'task': step.get('task', '')
-                        })
+            # Walk the steps directly; dangling dependency ids are never orphans
+            for step_id, step in self.steps_by_id.items():
+                if not self.reverse_graph.get(step_id) and step_id not in final_level_steps:
+                    self.issue_count += 1
+                    if limit is not None and len(issues) >= limit:
+                        continue
+                    issues.append({
+                        'type': 'orphaned_step',
+                        'step_id': step_id,
+                        'description': f"Step {step_id} has no dependents but is not final",
+                        'agent': step.get('agent'),
+                        'task': step.get('task', '')
+                    })
         
         # Check for steps with too many dependencies
         for step in self.steps:
             dependencies = step.get('dependencies', [])
             if len(dependencies) > 5:  # Threshold for complexity
+                self.issue_count += 1
+                if limit is not None and len(issues) >= limit:
+                    continue
                 issues.append({
                     'type': 'complex_dependencies',
                     'step_id': step['id'],
@@ -258,15 +309,15 @@ class DependencyAnalyzer:
         if not levels:
             return "No valid dependency structure found"
         
-        lines = []
-        lines.append("Execution Timeline (→ = depends on)")
-        lines.append("=" * 50)
+        out = io.StringIO()
+        print("Execution Timeline (→ = depends on)", file=out)
+        print("=" * 50, file=out)
         
         for level_num, level_steps in enumerate(levels, 1):
-            lines.append(f"\n📅 Level {level_num} (Parallel Execution):")
+            print(f"\n📅 Level {level_num} (Parallel Execution):", file=out)
             
             for step_id in level_steps:
-                step = next((s for s in self.steps if s['id'] == step_id), None)
+                step = self.steps_by_id.get(step_id)
                 if step:
                     agent = step.get('agent', 'unknown')
                     task = step.get('task', 'No task')
@@ -276,9 +327,9 @@ class DependencyAnalyzer:
                     deps = step.get('dependencies', [])
                     dep_str = f" → {deps}" if deps else ""
                     
-                    lines.append(f"  [{step_id}] {agent}: {task[:40]}... ({duration}){dep_str}")
+                    print(f"  [{step_id}] {agent}: {task[:40]}... ({duration}){dep_str}", file=out)
         
-        return "\n".join(lines)
+        return out.getvalue().rstrip('\n')
     
     def generate_report(self) -> str:
         """Generate comprehensive dependency analysis report."""
@@ -287,53 +338,59 @@ class DependencyAnalyzer:
         
         self.build_dependency_graph()
         
-        lines = []
-        lines.append(f"🔍 Dependency Analysis Report: {self.plan_file}")
-        lines.append("=" * 60)
+        out = io.StringIO()
+        print(f"🔍 Dependency Analysis Report: {self.plan_file}", file=out)
+        print("=" * 60, file=out)
         
         # Basic stats
-        lines.append(f"\n📊 Basic Statistics:")
-        lines.append(f"  • Total steps: {len(self.steps)}")
-        lines.append(f"  • Total dependencies: {sum(len(deps) for deps in self.dependency_graph.values())}")
+        print(f"\n📊 Basic Statistics:", file=out)
+        print(f"  • Total steps: {len(self.steps)}", file=out)
+        print(f"  • Total dependencies: {self.edge_count}", file=out)
         
         # Parallelization analysis
-        parallel_analysis = self.analyze_parallelization()
-        lines.append(f"\n⚡ Parallelization Analysis:")
-        lines.append(f"  • Execution levels: {parallel_analysis['execution_levels']}")
-        lines.append(f"  • Max parallel steps: {parallel_analysis['max_parallel_steps']}")
-        lines.append(f"  • Parallelization factor: {parallel_analysis['parallelization_factor']}x")
+        parallel_analysis = self.analyze_parallelization(bottleneck_limit=3)
+        print(f"\n⚡ Parallelization Analysis:", file=out)
+        print(f"  • Execution levels: {parallel_analysis['execution_levels']}", file=out)
+        print(f"  • Max parallel steps: {parallel_analysis['max_parallel_steps']}", file=out)
+        print(f"  • Parallelization factor: {parallel_analysis['parallelization_factor']}x", file=out)
         
         if parallel_analysis['bottlenecks']:
-            lines.append(f"\n🚧 Bottlenecks ({len(parallel_analysis['bottlenecks'])}):")
-            for bottleneck in parallel_analysis['bottlenecks'][:3]:  # Show first 3
-                lines.append(f"  • Level {bottleneck['level']}: Step {bottleneck['step_id']} ({bottleneck['agent']})")
+            print(f"\n🚧 Bottlenecks ({parallel_analysis['bottleneck_count']}):", file=out)
+            for bottleneck in parallel_analysis['bottlenecks']:  # First 3 only
+                print(f"  • Level {bottleneck['level']}: Step {bottleneck['step_id']} ({bottleneck['agent']})", file=out)
+        
+        # Circular dependencies (excluded from the critical path below)
+        self.topological_sort()
+        if self.has_cycle:
+            print(f"\n⛔ Circular Dependencies:", file=out)
+            print(f"  • Steps in or blocked by a cycle: {', '.join(map(str, self.cycle_nodes))}", file=out)
         
         # Critical path
         critical_path, critical_time = self.find_critical_path()
-        lines.append(f"\n⏰ Critical Path:")
-        lines.append(f"  • Path: {' → '.join(map(str, critical_path))}")
-        lines.append(f"  • Estimated time: {critical_time} days")
+        print(f"\n⏰ Critical Path:", file=out)
+        print(f"  • Path: {' → '.join(map(str, critical_path))}", file=out)
+        print(f"  • Estimated time: {critical_time} days", file=out)
         
         # Agent workload
         workload_analysis = self.analyze_agent_workload()
-        lines.append(f"\n👥 Agent Workload Distribution:")
+        print(f"\n👥 Agent Workload Distribution:", file=out)
         for agent, steps in workload_analysis['agent_distribution'].items():
-            lines.append(f"  • {agent}: {len(steps)} step(s)")
+            print(f"  • {agent}: {len(steps)} step(s)", file=out)
         
         balance = workload_analysis['workload_balance']
-        lines.append(f"  • Balance ratio: {balance['balance_ratio']} (1.0 = perfect balance)")
+        print(f"  • Balance ratio: {balance['balance_ratio']} (1.0 = perfect balance)", file=out)
         
         # Potential issues
-        issues = self.find_potential_deadlocks()
+        issues = self.find_potential_deadlocks(limit=3)
         if issues:
-            lines.append(f"\n⚠️ Potential Issues ({len(issues)}):")
-            for issue in issues[:3]:  # Show first 3
-                lines.append(f"  • {issue['type']}: {issue['description']}")
+            print(f"\n⚠️ Potential Issues ({self.issue_count}):", file=out)
+            for issue in issues:  # First 3 only
+                print(f"  • {issue['type']}: {issue['description']}", file=out)
         
         # ASCII timeline
-        lines.append(f"\n{self.generate_ascii_timeline()}")
+        print(f"\n{self.generate_ascii_timeline()}", file=out)
         
-        return "\n".join(lines)
+        return out.getvalue().rstrip('\n')
 
 def main():
     parser = argparse.ArgumentParser(description='Analyze dependencies in agent collaboration plans')
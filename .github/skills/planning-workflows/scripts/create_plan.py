@@ -8,14 +8,39 @@ based on project complexity and requirements.
 Usage: python create_plan.py [options]
 """
 
+import copy
+import io
 import json
 import sys
 import os
 import argparse
+from collections import Counter, defaultdict
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import shutil
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib parser
+    orjson = None
+
+class _FilenameTable(dict):
+    """Translate table for plan filenames: keep alphanumerics, '-' and '_'.
+
+    ASCII is filled up front; other code points are resolved with
+    ``str.isalnum`` on first sight and memoized.
+    """
+    
+    def __missing__(self, codepoint: int) -> int:
+        value = codepoint if chr(codepoint).isalnum() else ord('_')
+        self[codepoint] = value
+        return value
+
+
+_FILENAME_TABLE = _FilenameTable(
+    (cp, cp if chr(cp).isalnum() or chr(cp) in '-_' else ord('_')) for cp in range(128)
+)
+
 class PlanCreator:
     def __init__(self):
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -28,33 +53,57 @@ class PlanCreator:
             'complex': 'complex-project.json',
             'enterprise': 'enterprise-project.json'
         }
+        
+        # Parsed templates by complexity; callers always get a deep copy
+        self._template_cache: Dict[str, Dict[str, Any]] = {}
+        # Complexities with a template on disk, listed on first use
+        self._available_templates: Optional[List[str]] = None
     
     def get_available_templates(self) -> List[str]:
         """Get list of available complexity templates."""
-        available = []
-        for complexity, filename in self.complexity_templates.items():
-            template_path = os.path.join(self.templates_dir, filename)
-            if os.path.exists(template_path):
-                available.append(complexity)
-        return available
+        if self._available_templates is None:
+            # One directory read instead of a stat per template
+            try:
+                with os.scandir(self.templates_dir) as it:
+                    entries = {entry.name for entry in it if entry.is_file()}
+            except FileNotFoundError:
+                entries = set()
+            self._available_templates = [
+                complexity for complexity, filename in self.complexity_templates.items()
+                if filename in entries
+            ]
+        return list(self._available_templates)
     
     def load_template(self, complexity: str) -> Dict[str, Any]:
-        """Load a template based on complexity level."""
+        """Load a template based on complexity level.
+        
+        Returns a fresh deep copy of the cached template, owned by the caller.
+        """
         if complexity not in self.complexity_templates:
             raise ValueError(f"Unknown complexity: {complexity}")
         
+        if complexity in self._template_cache:
+            return copy.deepcopy(self._template_cache[complexity])
+        
         template_file = self.complexity_templates[complexity]
         template_path = os.path.join(self.templates_dir, template_file)
         
         if not os.path.exists(template_path):
             raise FileNotFoundError(f"Template not found: {template_path}")
         
-        with open(template_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(template_path, 'rb') as f:
+            raw = f.read()
+        self._template_cache[complexity] = orjson.loads(raw) if orjson else json.loads(raw)
+        
+        return copy.deepcopy(self._template_cache[complexity])
     
     def customize_template(self, template: Dict[str, Any], customizations: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply customizations to the template."""
-        customized = template.copy()
+        """Apply customizations to the template.
+        
+        Takes ownership of ``template``: it is modified in place and returned,
+        so pass a copy (as `load_template` returns) to keep the original.
+        """
+        customized = template
         
         # Basic customizations
         if 'task_name' in customizations:
@@ -68,16 +117,20 @@ class PlanCreator:
         
         # Advanced customizations
         if 'exclude_agents' in customizations:
+            # Drop excluded agents' steps and prune dangling dependencies in one pass
             excluded = set(customizations['exclude_agents'])
-            steps = customized.get('steps', [])
-            customized['steps'] = [
-                step for step in steps 
-                if step.get('agent') not in excluded
-            ]
-            self._recalculate_dependencies(customized['steps'])
+            kept = [step for step in customized.get('steps', []) if step.get('agent') not in excluded]
+            kept_ids = {step['id'] for step in kept}
+            for step in kept:
+                step['dependencies'] = [dep for dep in step.get('dependencies', ()) if dep in kept_ids]
+            customized['steps'] = kept
         
         if 'focus_areas' in customizations:
-            self._prioritize_focus_areas(customized, customizations['focus_areas'])
+            # Index the remaining steps by agent once for the focus-area pass
+            agent_index = defaultdict(list)
+            for step in customized.get('steps', []):
+                agent_index[step.get('agent', '')].append(step)
+            self._prioritize_focus_areas(customized, customizations['focus_areas'], agent_index)
         
         # Add metadata
         customized['_metadata'] = {
@@ -88,25 +141,21 @@ class PlanCreator:
         
         return customized
     
-    def _recalculate_dependencies(self, steps: List[Dict[str, Any]]):
-        """Recalculate dependencies after removing steps."""
-        step_ids = {step['id'] for step in steps}
+    def _prioritize_focus_areas(self, plan: Dict[str, Any], focus_areas: List[str],
+                                agent_index: Dict[str, List[Dict[str, Any]]]):
+        """Adjust plan based on focus areas.
         
-        for step in steps:
-            original_deps = step.get('dependencies', [])
-            valid_deps = [dep for dep in original_deps if dep in step_ids]
-            step['dependencies'] = valid_deps
-    
-    def _prioritize_focus_areas(self, plan: Dict[str, Any], focus_areas: List[str]):
-        """Adjust plan based on focus areas."""
+        ``agent_index`` maps each agent to its steps in ``plan`` (by reference).
+        """
         # This could be expanded to reorder steps, add emphasis, etc.
         plan['focus_areas'] = focus_areas
         
         # Example: If data is a focus, add more data validation steps
         if 'data' in focus_areas:
-            steps = plan.get('steps', [])
-            for step in steps:
-                if '@data-specialist' in step.get('agent', ''):
+            for agent, agent_steps in agent_index.items():
+                if '@data-specialist' not in agent:
+                    continue
+                for step in agent_steps:
                     # Add extra validation to data-focused steps
                     criteria = step.get('success_criteria', [])
                     if 'Data quality validated' not in criteria:
@@ -183,44 +232,46 @@ class PlanCreator:
         if not output_file:
             task_name = plan.get('task_name', 'untitled').lower()
             # Sanitize filename
-            filename = ''.join(c if c.isalnum() or c in '-_' else '_' for c in task_name)
+            filename = task_name.translate(_FILENAME_TABLE)
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             output_file = f"plan_{filename}_{timestamp}.json"
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(plan, f, indent=2, ensure_ascii=False)
+        if orjson:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(plan, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(plan, f, indent=2, ensure_ascii=False)
         
         return output_file
     
     def preview_plan(self, plan: Dict[str, Any]) -> str:
         """Generate a preview summary of the plan."""
-        lines = []
-        lines.append(f"📋 Plan Preview: {plan.get('task_name', 'Untitled')}")
-        lines.append(f"📄 Description: {plan.get('description', 'No description')}")
-        lines.append(f"⏱️  Duration: {plan.get('estimated_duration', 'Unknown')}")
-        lines.append(f"🎯 Complexity: {plan.get('complexity_level', 'Unknown')}")
+        out = io.StringIO()
+        print(f"📋 Plan Preview: {plan.get('task_name', 'Untitled')}", file=out)
+        print(f"📄 Description: {plan.get('description', 'No description')}", file=out)
+        print(f"⏱️  Duration: {plan.get('estimated_duration', 'Unknown')}", file=out)
+        print(f"🎯 Complexity: {plan.get('complexity_level', 'Unknown')}", file=out)
         
         steps = plan.get('steps', [])
-        lines.append(f"\n📝 Steps ({len(steps)}):")
+        print(f"\n📝 Steps ({len(steps)}):", file=out)
         
+        # List the steps and tally agents in the same pass
+        agent_counts = Counter()
         for step in steps:
             step_id = step.get('id', '?')
             agent = step.get('agent', '?')
             task = step.get('task', 'No task description')
             duration = step.get('estimated_time', '?')
-            lines.append(f"  {step_id}. {agent}: {task} ({duration})")
-        
-        # Show agent distribution
-        agent_counts = {}
-        for step in steps:
-            agent = step.get('agent', 'unknown')
-            agent_counts[agent] = agent_counts.get(agent, 0) + 1
+            print(f"  {step_id}. {agent}: {task} ({duration})", file=out)
+            agent_counts[step.get('agent', 'unknown')] += 1
         
-        lines.append(f"\n👥 Agent Distribution:")
-        for agent, count in sorted(agent_counts.items()):
-            lines.append(f"  {agent}: {count} step(s)")
+        # Show agent distribution, busiest agents first
+        print(f"\n👥 Agent Distribution:", file=out)
+        for agent, count in agent_counts.most_common():
+            print(f"  {agent}: {count} step(s)", file=out)
         
-        return "\n".join(lines)
+        return out.getvalue().rstrip('\n')
 
 def main():
     parser = argparse.ArgumentParser(description='Create agent collaboration planning files')
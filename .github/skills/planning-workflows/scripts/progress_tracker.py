@@ -7,16 +7,74 @@ across VSCode sessions by updating plan files or maintaining separate progress f
 
 Usage: 
   python progress_tracker.py --plan plan-file.json --complete-step 3
+  python progress_tracker.py --plan plan-file.json --complete-step 3 4 5
   python progress_tracker.py --plan plan-file.json --status
   python progress_tracker.py --plan plan-file.json --reset
 """
 
+import io
 import json
+import mmap
 import sys
 import os
 import argparse
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Set, Any, Optional
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib parser
+    orjson = None
+
+# Step status icons in the progress report
+ICON_COMPLETED = "✅"
+ICON_AVAILABLE = "🟡"
+ICON_BLOCKED = "⏳"
+
+# Plans with at least this many steps are written to disk one step at a time
+STREAM_MIN_STEPS = 1000
+
+def _load_json_file(path: str) -> Any:
+    """Parse a JSON file, memory-mapping it when orjson is available.
+
+    orjson parses straight from the mapped pages, avoiding a full in-memory
+    copy of the file; empty files cannot be mapped and take the plain path.
+    """
+    with open(path, 'rb') as f:
+        if orjson and os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def _write_json(f, data: Any):
+    """Write ``data`` to binary file ``f`` as 2-space indented JSON via orjson.
+
+    A plan with a large ``steps`` list is serialized one step at a time, so
+    only a single step's bytes are held in memory instead of the whole file.
+    The output is byte-identical to a single ``orjson.dumps`` call.
+    """
+    steps = data.get('steps') if isinstance(data, dict) else None
+    if not isinstance(steps, list) or len(steps) < STREAM_MIN_STEPS:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    
+    # JSON strings cannot hold raw newlines, so re-indenting nested values
+    # only ever touches the layout
+    f.write(b'{')
+    for i, (key, value) in enumerate(data.items()):
+        f.write(b',\n  ' if i else b'\n  ')
+        f.write(orjson.dumps(key) + b': ')
+        if key == 'steps':
+            f.write(b'[')
+            for j, step in enumerate(value):
+                f.write(b',\n    ' if j else b'\n    ')
+                f.write(orjson.dumps(step, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n    '))
+            f.write(b'\n  ]')
+        else:
+            f.write(orjson.dumps(value, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n  '))
+    f.write(b'\n}')
 
 class ProgressTracker:
     def __init__(self, plan_file: str, use_separate_file: bool = True):
@@ -29,15 +87,28 @@ class ProgressTracker:
             self.progress_file = f"{base_name}.progress.json"
         else:
             self.progress_file = plan_file
+        
+        # Fixed for the tracker's lifetime; generate_report may run repeatedly
+        self._plan_basename = os.path.basename(plan_file)
+        self._report_header = [f"📋 Progress Report: {self._plan_basename}", "=" * 60]
             
         self.plan_data = None
         self.progress_data = None
+        self._steps_by_id: Dict[int, Dict[str, Any]] = {}
+        # Completed step ids as a set; rebuilt lazily after any change
+        self._completed_set = None
+        # Inside batch(), updates are kept in memory and saved once on exit
+        self._batch_depth = 0
+        self._dirty = False
     
     def load_plan(self) -> bool:
         """Load the planning file."""
         try:
-            with open(self.plan_file, 'r', encoding='utf-8') as f:
-                self.plan_data = json.load(f)
+            self.plan_data = _load_json_file(self.plan_file)
+            # First step wins on duplicate ids, as the old linear scans did
+            self._steps_by_id = {}
+            for step in self.plan_data.get('steps', []):
+                self._steps_by_id.setdefault(step.get('id'), step)
             return True
         except Exception as e:
             print(f"Error loading plan: {e}")
@@ -45,20 +116,21 @@ class ProgressTracker:
     
     def load_progress(self) -> bool:
         """Load progress data."""
+        self._completed_set = None
         if not self.use_separate_file:
             self.progress_data = self.plan_data
             return True
             
         try:
             if os.path.exists(self.progress_file):
-                with open(self.progress_file, 'r', encoding='utf-8') as f:
-                    self.progress_data = json.load(f)
+                self.progress_data = _load_json_file(self.progress_file)
             else:
                 # Initialize new progress file
+                now = datetime.now().isoformat()
                 self.progress_data = {
                     "plan_file": self.plan_file,
-                    "created_date": datetime.now().isoformat(),
-                    "last_updated": datetime.now().isoformat(),
+                    "created_date": now,
+                    "last_updated": now,
                     "completed_steps": [],
                     "current_step": None,
                     "notes": {},
@@ -75,34 +147,61 @@ class ProgressTracker:
             return False
         
         # Validate step exists
-        steps = self.plan_data.get('steps', [])
-        step_exists = any(step['id'] == step_id for step in steps)
+        step = self._steps_by_id.get(step_id)
         
-        if not step_exists:
+        if step is None:
             print(f"Error: Step {step_id} not found in plan")
             return False
         
+        now = datetime.now().isoformat()
         if self.use_separate_file:
             # Update progress file
             if step_id not in self.progress_data['completed_steps']:
                 self.progress_data['completed_steps'].append(step_id)
                 self.progress_data['completed_steps'].sort()
             
-            self.progress_data['last_updated'] = datetime.now().isoformat()
+            self.progress_data['last_updated'] = now
             
             if notes:
                 self.progress_data['notes'][str(step_id)] = notes
+            
+            self._completed_set = None
         else:
             # Update plan file directly
-            for step in steps:
-                if step['id'] == step_id:
-                    step['status'] = 'completed'
-                    step['completed_date'] = datetime.now().isoformat()
-                    if notes:
-                        step['completion_notes'] = notes
-                    break
+            step['status'] = 'completed'
+            step['completed_date'] = now
+            if notes:
+                step['completion_notes'] = notes
+            
+            self._completed_set = None
         
-        return self.save_progress()
+        return self._persist()
+    
+    def complete_steps(self, step_ids: List[int], notes: Optional[Dict[int, str]] = None) -> List[int]:
+        """Mark several steps as completed with a single save.
+        
+        Returns the ids that could not be completed (empty on full success).
+        Valid steps are saved even when others fail; if the save itself fails,
+        every id is returned.
+        """
+        notes = notes or {}
+        with self.batch():
+            failed = [step_id for step_id in step_ids if not self.complete_step(step_id, notes.get(step_id))]
+        if self._dirty:
+            return list(step_ids)
+        return failed
+    
+    def _completed_ids(self) -> Set[int]:
+        """Completed step ids as a set, cached until progress changes."""
+        if self._completed_set is None:
+            if self.use_separate_file:
+                self._completed_set = set(self.progress_data.get('completed_steps', []))
+            else:
+                self._completed_set = {
+                    step['id'] for step in self.plan_data.get('steps', [])
+                    if step.get('status') == 'completed'
+                }
+        return self._completed_set
     
     def get_status(self) -> Dict[str, Any]:
         """Get current progress status."""
@@ -119,15 +218,13 @@ class ProgressTracker:
             completed = [step['id'] for step in steps if step.get('status') == 'completed']
             completed_count = len(completed)
         
-        # Calculate next steps
-        next_steps = []
-        for step in steps:
-            step_id = step['id']
-            if step_id not in completed:
-                # Check if dependencies are met
-                dependencies = step.get('dependencies', [])
-                if all(dep in completed for dep in dependencies):
-                    next_steps.append(step_id)
+        # Calculate next steps: not yet done, with every dependency met
+        completed_set = self._completed_ids()
+        next_steps = [
+            step['id'] for step in steps
+            if step['id'] not in completed_set
+            and completed_set.issuperset(step.get('dependencies', []))
+        ]
         
         return {
             'total_steps': total_steps,
@@ -138,27 +235,73 @@ class ProgressTracker:
             'last_updated': self.progress_data.get('last_updated') if self.use_separate_file else datetime.now().isoformat()
         }
     
+    @contextmanager
+    def batch(self):
+        """Defer saves until the block exits, then write once if anything changed."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+    
+    def flush(self) -> bool:
+        """Save pending batched updates, if any."""
+        if not self._dirty:
+            return True
+        if self.save_progress():
+            self._dirty = False
+            return True
+        return False
+    
+    def _persist(self) -> bool:
+        """Save now, or mark pending when inside a batch."""
+        if self._batch_depth:
+            self._dirty = True
+            return True
+        return self.save_progress()
+    
     def save_progress(self) -> bool:
-        """Save progress data."""
+        """Save progress data.
+        
+        Writes to a temporary file and renames it over the target, so a crash
+        mid-write never leaves a truncated progress (or plan) file behind.
+        """
+        if self.use_separate_file:
+            path, data = self.progress_file, self.progress_data
+        else:
+            path, data = self.plan_file, self.plan_data
+        
+        tmp_path = path + '.tmp'
         try:
-            if self.use_separate_file:
-                with open(self.progress_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.progress_data, f, indent=2, ensure_ascii=False)
+            if orjson:
+                with open(tmp_path, 'wb') as f:
+                    _write_json(f, data)
+                    f.flush()
+                    os.fsync(f.fileno())
             else:
-                with open(self.plan_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.plan_data, f, indent=2, ensure_ascii=False)
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, path)
             return True
         except Exception as e:
             print(f"Error saving progress: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
             return False
     
     def reset_progress(self) -> bool:
         """Reset all progress."""
+        self._completed_set = None
         if self.use_separate_file:
+            now = datetime.now().isoformat()
             self.progress_data = {
                 "plan_file": self.plan_file,
-                "created_date": datetime.now().isoformat(),
-                "last_updated": datetime.now().isoformat(),
+                "created_date": now,
+                "last_updated": now,
                 "completed_steps": [],
                 "current_step": None,
                 "notes": {},
@@ -171,80 +314,82 @@ class ProgressTracker:
                 step.pop('completed_date', None)
                 step.pop('completion_notes', None)
         
-        return self.save_progress()
+        return self._persist()
     
     def add_note(self, step_id: int, note: str) -> bool:
         """Add a note to a specific step."""
+        now = datetime.now().isoformat()
         if self.use_separate_file:
             self.progress_data['notes'][str(step_id)] = note
-            self.progress_data['last_updated'] = datetime.now().isoformat()
+            self.progress_data['last_updated'] = now
         else:
-            steps = self.plan_data.get('steps', [])
-            for step in steps:
-                if step['id'] == step_id:
-                    if 'notes' not in step:
-                        step['notes'] = []
-                    step['notes'].append({
-                        'date': datetime.now().isoformat(),
-                        'note': note
-                    })
-                    break
+            step = self._steps_by_id.get(step_id)
+            if step is not None:
+                step.setdefault('notes', []).append({
+                    'date': now,
+                    'note': note
+                })
         
-        return self.save_progress()
+        return self._persist()
     
     def generate_report(self) -> str:
         """Generate a progress report."""
         status = self.get_status()
-        lines = []
-        
-        lines.append(f"📋 Progress Report: {os.path.basename(self.plan_file)}")
-        lines.append("=" * 60)
+        completed_set = self._completed_ids()
+        next_set = set(status['next_available_steps'])
+        out = io.StringIO()
+        for line in self._report_header:
+            print(line, file=out)
         
-        lines.append(f"📊 Overall Progress: {status['completed_count']}/{status['total_steps']} steps ({status['completion_percentage']}%)")
-        lines.append(f"📅 Last Updated: {status['last_updated']}")
+        print(f"📊 Overall Progress: {status['completed_count']}/{status['total_steps']} steps ({status['completion_percentage']}%)", file=out)
+        print(f"📅 Last Updated: {status['last_updated']}", file=out)
         
         if status['completed_steps']:
-            lines.append(f"\n✅ Completed Steps: {', '.join(map(str, status['completed_steps']))}")
+            print(f"\n✅ Completed Steps: {', '.join(map(str, status['completed_steps']))}", file=out)
         
         if status['next_available_steps']:
-            lines.append(f"\n⏭️  Next Available Steps: {', '.join(map(str, status['next_available_steps']))}")
+            print(f"\n⏭️  Next Available Steps: {', '.join(map(str, status['next_available_steps']))}", file=out)
         else:
             remaining = status['total_steps'] - status['completed_count']
             if remaining > 0:
-                lines.append(f"\n⏳ Waiting for Dependencies: {remaining} steps blocked")
+                print(f"\n⏳ Waiting for Dependencies: {remaining} steps blocked", file=out)
             else:
-                lines.append(f"\n🎉 All Steps Completed!")
+                print(f"\n🎉 All Steps Completed!", file=out)
         
         # Show step details
         if self.plan_data:
-            lines.append(f"\n📝 Step Details:")
+            print(f"\n📝 Step Details:", file=out)
             steps = self.plan_data.get('steps', [])
             for step in steps:
                 step_id = step['id']
                 agent = step.get('agent', 'unknown')
-                task = step.get('task', 'No description')[:50] + '...' if len(step.get('task', '')) > 50 else step.get('task', '')
+                task = step.get('task', '')
+                if len(task) > 50:
+                    task = task[:50] + '...'
                 
-                if step_id in status['completed_steps']:
-                    icon = "✅"
-                elif step_id in status['next_available_steps']:
-                    icon = "🟡"
+                if step_id in completed_set:
+                    icon = ICON_COMPLETED
+                elif step_id in next_set:
+                    icon = ICON_AVAILABLE
                 else:
-                    icon = "⏳"
+                    icon = ICON_BLOCKED
                 
-                lines.append(f"  {icon} [{step_id}] {agent}: {task}")
+                print(f"  {icon} [{step_id}] {agent}: {task}", file=out)
         
         # Show notes if any
         if self.use_separate_file and self.progress_data.get('notes'):
-            lines.append(f"\n📌 Notes:")
+            print(f"\n📌 Notes:", file=out)
             for step_id, note in self.progress_data['notes'].items():
-                lines.append(f"  Step {step_id}: {note}")
+                print(f"  Step {step_id}: {note}", file=out)
         
-        return "\n".join(lines)
+        # Drop the final newline only, so the text matches the old line join
+        return out.getvalue()[:-1]
 
 def main():
     parser = argparse.ArgumentParser(description='Track progress of planning workflows')
     parser.add_argument('--plan', required=True, help='Path to planning JSON file')
-    parser.add_argument('--complete-step', type=int, help='Mark step as completed')
+    parser.add_argument('--complete-step', type=int, nargs='+', metavar='STEP',
+                       help='Mark one or more steps as completed (saved once)')
     parser.add_argument('--note', help='Add note to step (use with --complete-step)')
     parser.add_argument('--add-note', type=int, help='Add note to specific step')
     parser.add_argument('--note-text', help='Note text (use with --add-note)')
@@ -269,11 +414,15 @@ def main():
     
     try:
         if args.complete_step:
-            success = tracker.complete_step(args.complete_step, args.note)
-            if success:
-                print(f"✅ Step {args.complete_step} marked as completed")
-            else:
-                print(f"❌ Failed to complete step {args.complete_step}")
+            notes = dict.fromkeys(args.complete_step, args.note) if args.note else None
+            failed = tracker.complete_steps(args.complete_step, notes)
+            completed = [step_id for step_id in args.complete_step if step_id not in failed]
+            if completed:
+                label = "Steps" if len(completed) > 1 else "Step"
+                print(f"✅ {label} {', '.join(map(str, completed))} marked as completed")
+            if failed:
+                label = "steps" if len(failed) > 1 else "step"
+                print(f"❌ Failed to complete {label} {', '.join(map(str, failed))}")
         
         elif args.add_note:
             if not args.note_text:
@@ -9,12 +9,48 @@ Usage: python validate_plan.py <plan_file.json>
 """
 
 import json
+import mmap
+import re
 import sys
 import os
 from datetime import datetime
 from typing import Dict, List, Set, Any, Tuple
+from collections import Counter, deque
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib parser
+    orjson = None
+
+# Time estimates such as "3 days" or "1-2 weeks": (min, max or '', unit)
+_TIME_RE = re.compile(r'(\d+)(?:-(\d+))?\s*(\w+)')
+_WEEKS_RE = re.compile(r'(\d+)(?:-(\d+))?\s*weeks?')
+
+def _load_json_file(path: str) -> Any:
+    """Parse a JSON file, memory-mapping it when orjson is available.
+
+    orjson parses straight from the mapped pages, avoiding a full in-memory
+    copy of the file; empty files cannot be mapped and take the plain path.
+    """
+    with open(path, 'rb') as f:
+        if orjson and os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
 
 class PlanValidator:
+    VALID_AGENTS = [
+        '@router', '@tech-specialist', '@business-specialist',
+        '@creative-specialist', '@data-specialist', '@validator'
+    ]
+    
+    TIME_UNITS = {
+        'days': 1, 'day': 1,
+        'weeks': 7, 'week': 7, 
+        'months': 30, 'month': 30
+    }
+    
     def __init__(self, plan_file: str):
         self.plan_file = plan_file
         self.plan_data = None
@@ -24,8 +60,7 @@ class PlanValidator:
     def load_plan(self) -> bool:
         """Load and parse the planning file."""
         try:
-            with open(self.plan_file, 'r', encoding='utf-8') as f:
-                self.plan_data = json.load(f)
+            self.plan_data = _load_json_file(self.plan_file)
             return True
         except FileNotFoundError:
             self.errors.append(f"File not found: {self.plan_file}")
@@ -63,26 +98,27 @@ class PlanValidator:
     
     def validate_agents(self) -> bool:
         """Validate that all referenced agents exist in the system."""
-        valid_agents = [
-            '@router', '@tech-specialist', '@business-specialist',
-            '@creative-specialist', '@data-specialist', '@validator'
-        ]
-        
-        steps = self.plan_data.get('steps', [])
-        for step in steps:
-            agent = step.get('agent')
-            if not agent:
-                self.errors.append(f"Step {step.get('id', 'unknown')} missing agent assignment")
-            elif agent not in valid_agents:
-                self.warnings.append(f"Unknown agent '{agent}' in step {step.get('id')}. Valid agents: {valid_agents}")
+        for step in self.plan_data.get('steps', []):
+            self._check_agent(step, self.errors, self.warnings)
         
         return True
     
+    def _check_agent(self, step: Dict, errors: List[str], warnings: List[str]):
+        agent = step.get('agent')
+        if not agent:
+            errors.append(f"Step {step.get('id', 'unknown')} missing agent assignment")
+        elif agent not in self.VALID_AGENTS:
+            warnings.append(f"Unknown agent '{agent}' in step {step.get('id')}. Valid agents: {self.VALID_AGENTS}")
+    
     def validate_dependencies(self) -> bool:
         """Validate step dependencies for logical consistency."""
         steps = self.plan_data.get('steps', [])
         step_ids = {step.get('id') for step in steps}
+        self._check_dependencies(steps, step_ids)
         
+        return len(self.errors) == 0
+    
+    def _check_dependencies(self, steps: List[Dict], step_ids: Set[Any]):
         # Check for duplicate step IDs
         if len(step_ids) != len(steps):
             self.errors.append("Duplicate step IDs detected")
@@ -90,9 +126,7 @@ class PlanValidator:
         # Validate dependency references
         for step in steps:
             step_id = step.get('id')
-            dependencies = step.get('dependencies', [])
-            
-            for dep in dependencies:
+            for dep in step.get('dependencies', []):
                 if dep not in step_ids:
                     self.errors.append(f"Step {step_id} references non-existent dependency: {dep}")
                 elif dep >= step_id:
@@ -101,112 +135,146 @@ class PlanValidator:
         # Check for circular dependencies
         if self._has_circular_dependencies(steps):
             self.errors.append("Circular dependencies detected in step workflow")
-        
-        return len(self.errors) == 0
     
     def _has_circular_dependencies(self, steps: List[Dict]) -> bool:
-        """Check for circular dependencies using DFS."""
+        """Check for circular dependencies with Kahn's algorithm.
+        
+        Steps are peeled off once all their dependencies are done; any step
+        left over sits on or behind a cycle. Iterative, so long dependency
+        chains cannot hit the recursion limit.
+        """
         step_deps = {step['id']: step.get('dependencies', []) for step in steps}
-        visited = set()
-        rec_stack = set()
+        dependents = {}
+        in_degree = {}
         
-        def dfs(node):
-            visited.add(node)
-            rec_stack.add(node)
-            
-            for neighbor in step_deps.get(node, []):
-                if neighbor not in visited:
-                    if dfs(neighbor):
-                        return True
-                elif neighbor in rec_stack:
-                    return True
-            
-            rec_stack.remove(node)
-            return False
+        for step_id, deps in step_deps.items():
+            # Unknown dependency ids are reported elsewhere; they cannot form a cycle
+            known = [dep for dep in deps if dep in step_deps]
+            in_degree[step_id] = len(known)
+            for dep in known:
+                dependents.setdefault(dep, []).append(step_id)
         
-        for step_id in step_deps:
-            if step_id not in visited:
-                if dfs(step_id):
-                    return True
+        queue = deque(step_id for step_id, degree in in_degree.items() if degree == 0)
+        processed = 0
+        while queue:
+            node = queue.popleft()
+            processed += 1
+            for dependent in dependents.get(node, ()):
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
         
-        return False
+        return processed < len(in_degree)
     
     def validate_deliverables(self) -> bool:
         """Validate deliverable naming and consistency."""
-        steps = self.plan_data.get('steps', [])
         deliverables = set()
-        
-        for step in steps:
-            deliverable = step.get('deliverable')
-            if not deliverable:
-                self.warnings.append(f"Step {step.get('id')} missing deliverable specification")
-            elif deliverable in deliverables:
-                self.warnings.append(f"Duplicate deliverable name: {deliverable}")
-            else:
-                deliverables.add(deliverable)
-                
-                # Check naming convention
-                if not deliverable.endswith('.md'):
-                    self.warnings.append(f"Deliverable '{deliverable}' should end with .md for consistency")
+        for step in self.plan_data.get('steps', []):
+            self._check_deliverable(step, deliverables, self.warnings)
         
         return True
     
+    def _check_deliverable(self, step: Dict, seen: Set[str], warnings: List[str]):
+        deliverable = step.get('deliverable')
+        if not deliverable:
+            warnings.append(f"Step {step.get('id')} missing deliverable specification")
+        elif deliverable in seen:
+            warnings.append(f"Duplicate deliverable name: {deliverable}")
+        else:
+            seen.add(deliverable)
+            
+            # Check naming convention
+            if not deliverable.endswith('.md'):
+                warnings.append(f"Deliverable '{deliverable}' should end with .md for consistency")
+    
     def validate_time_estimates(self) -> bool:
         """Validate time estimates for reasonableness."""
-        steps = self.plan_data.get('steps', [])
-        total_time_days = 0
-        
-        time_units = {
-            'days': 1, 'day': 1,
-            'weeks': 7, 'week': 7, 
-            'months': 30, 'month': 30
-        }
+        total_time_days = sum(
+            self._step_time_days(step, self.warnings) for step in self.plan_data.get('steps', [])
+        )
+        self._check_total_time(total_time_days)
         
-        for step in steps:
-            time_est = step.get('estimated_time', '')
-            if time_est:
-                # Parse time estimate (e.g., "1-2 weeks", "3 days")
-                try:
-                    # Simple parsing - extract numbers and units
-                    import re
-                    matches = re.findall(r'(\d+)(?:-(\d+))?\s*(\w+)', time_est.lower())
-                    if matches:
-                        min_time, max_time, unit = matches[0]
-                        multiplier = time_units.get(unit, 1)
-                        days = int(max_time or min_time) * multiplier
-                        total_time_days += days
-                except:
-                    self.warnings.append(f"Could not parse time estimate in step {step.get('id')}: '{time_est}'")
+        return True
+    
+    def _step_time_days(self, step: Dict, warnings: List[str]) -> int:
+        """Upper bound of a step's time estimate in days (0 if absent)."""
+        time_est = step.get('estimated_time', '')
+        if not time_est:
+            return 0
         
+        # Parse time estimate (e.g., "1-2 weeks", "3 days")
+        try:
+            # Simple parsing - extract numbers and units
+            matches = _TIME_RE.findall(time_est.lower())
+            if matches:
+                min_time, max_time, unit = matches[0]
+                multiplier = self.TIME_UNITS.get(unit, 1)
+                return int(max_time or min_time) * multiplier
+        except:
+            warnings.append(f"Could not parse time estimate in step {step.get('id')}: '{time_est}'")
+        return 0
+    
+    def _check_total_time(self, total_time_days: int):
         # Compare with overall estimated duration
         overall_duration = self.plan_data.get('estimated_duration', '')
         if 'week' in overall_duration.lower():
-            import re
-            weeks_match = re.search(r'(\d+)(?:-(\d+))?\s*weeks?', overall_duration.lower())
+            weeks_match = _WEEKS_RE.search(overall_duration.lower())
             if weeks_match:
                 max_weeks = int(weeks_match.group(2) or weeks_match.group(1))
                 if total_time_days > max_weeks * 7 * 1.5:  # 50% buffer
                     self.warnings.append(f"Step time estimates ({total_time_days} days) seem high compared to overall duration")
-        
-        return True
     
     def validate_success_criteria(self) -> bool:
         """Validate success criteria completeness."""
-        steps = self.plan_data.get('steps', [])
-        
-        for step in steps:
-            criteria = step.get('success_criteria', [])
-            if not criteria:
-                self.warnings.append(f"Step {step.get('id')} missing success criteria")
-            elif len(criteria) < 2:
-                self.warnings.append(f"Step {step.get('id')} has minimal success criteria (consider adding more)")
+        for step in self.plan_data.get('steps', []):
+            self._check_success_criteria(step, self.warnings)
+        self._check_overall_criteria()
         
+        return True
+    
+    def _check_success_criteria(self, step: Dict, warnings: List[str]):
+        criteria = step.get('success_criteria', [])
+        if not criteria:
+            warnings.append(f"Step {step.get('id')} missing success criteria")
+        elif len(criteria) < 2:
+            warnings.append(f"Step {step.get('id')} has minimal success criteria (consider adding more)")
+    
+    def _check_overall_criteria(self):
         # Validate overall validation criteria
         overall_criteria = self.plan_data.get('validation_criteria', [])
         if len(overall_criteria) < 3:
             self.warnings.append("Consider adding more comprehensive validation criteria for the overall project")
+    
+    def _validate_steps(self):
+        """Run every per-step check in a single pass over the steps.
         
-        return True
+        Messages are buffered per check and flushed in the same order as the
+        individual ``validate_*`` methods, so the report reads identically.
+        The cycle check still walks the full dependency graph on its own.
+        """
+        steps = self.plan_data.get('steps', [])
+        agent_errors, agent_warnings = [], []
+        deliverable_warnings, time_warnings, criteria_warnings = [], [], []
+        deliverables = set()
+        step_ids = set()
+        total_time_days = 0
+        
+        for step in steps:
+            self._check_agent(step, agent_errors, agent_warnings)
+            step_ids.add(step.get('id'))
+            self._check_deliverable(step, deliverables, deliverable_warnings)
+            total_time_days += self._step_time_days(step, time_warnings)
+            self._check_success_criteria(step, criteria_warnings)
+        
+        self.errors.extend(agent_errors)
+        self.warnings.extend(agent_warnings)
+        # Dependency references need every step id, so they are checked afterwards
+        self._check_dependencies(steps, step_ids)
+        self.warnings.extend(deliverable_warnings)
+        self.warnings.extend(time_warnings)
+        self._check_total_time(total_time_days)
+        self.warnings.extend(criteria_warnings)
+        self._check_overall_criteria()
     
     def generate_report(self) -> str:
         """Generate a validation report."""
@@ -238,10 +306,7 @@ class PlanValidator:
             report.append(f"  • Duration: {self.plan_data.get('estimated_duration', 'unknown')}")
             
             # Count agents
-            agents = [step.get('agent') for step in steps]
-            agent_counts = {}
-            for agent in agents:
-                agent_counts[agent] = agent_counts.get(agent, 0) + 1
+            agent_counts = Counter(step.get('agent') for step in steps)
             report.append(f"  • Agent distribution: {dict(agent_counts)}")
         
         return "\n".join(report)
@@ -252,11 +317,7 @@ class PlanValidator:
             return False
         
         self.validate_structure()
-        self.validate_agents() 
-        self.validate_dependencies()
-        self.validate_deliverables()
-        self.validate_time_estimates()
-        self.validate_success_criteria()
+        self._validate_steps()
         
         return len(self.errors) == 0
 
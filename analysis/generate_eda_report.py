@@ -7,8 +7,63 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 
-# Load data
-df = pd.read_csv('data/california_housing.csv')
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:  # optional: multi-threaded CSV parsing
+    pa = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # optional: parallel outlier kernel
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def iqr_outlier_counts(arr):
+        """Per-column count of values outside 1.5*IQR of the quartiles.
+
+        Columns run in parallel; quartiles use linear interpolation over the
+        non-NaN values, matching pandas' default quantile.
+        """
+        n_rows, n_cols = arr.shape
+        counts = np.zeros(n_cols, dtype=np.int64)
+        for j in prange(n_cols):
+            col = np.sort(arr[:, j])  # NaNs sort to the end
+            n = n_rows
+            while n > 0 and np.isnan(col[n - 1]):
+                n -= 1
+            if n == 0:
+                continue
+            bounds = np.empty(2)
+            for k, q in enumerate((0.25, 0.75)):
+                pos = q * (n - 1)
+                lo = int(np.floor(pos))
+                hi = min(lo + 1, n - 1)
+                bounds[k] = col[lo] + (col[hi] - col[lo]) * (pos - lo)
+            iqr = bounds[1] - bounds[0]
+            low, high = bounds[0] - 1.5 * iqr, bounds[1] + 1.5 * iqr
+            for i in range(n):
+                if col[i] < low or col[i] > high:
+                    counts[j] += 1
+        return counts
+
+# Load data: the measurements fit float32, which halves the memory every
+# reduction below has to stream; property_id stays a string ('PROP_000000')
+SCHEMA = {
+    'MedInc': np.float32, 'HouseAge': np.float32, 'AveRooms': np.float32,
+    'AveBedrms': np.float32, 'Population': np.float32, 'AveOccup': np.float32,
+    'Latitude': np.float32, 'Longitude': np.float32, 'MedHouseVal': np.float32,
+}
+if pa is not None:
+    convert_options = pacsv.ConvertOptions(
+        column_types={col: pa.from_numpy_dtype(dtype) for col, dtype in SCHEMA.items()}
+    )
+    table = pacsv.read_csv('data/california_housing.csv', convert_options=convert_options)
+    df = table.to_pandas(self_destruct=True)
+    del table
+else:
+    df = pd.read_csv('data/california_housing.csv', dtype=SCHEMA, engine='c')
 
 print('='*80)
 print('CALIFORNIA HOUSING - EXPLORATORY DATA ANALYSIS REPORT')
@@ -27,14 +82,19 @@ print()
 print('2. DATA QUALITY ASSESSMENT')
 print('-' * 40)
 print('Missing Values:')
-missing = df.isnull().sum()
+# One reduction over the whole null mask instead of a Series per column
+missing = pd.Series(df.isna().to_numpy().sum(axis=0), index=df.columns)
 if missing.sum() == 0:
     print('  ✅ No missing values detected')
 else:
     print(missing[missing > 0])
 print()
 print('Duplicate Records:')
-duplicates = df.duplicated().sum()
+# property_id is the record key: hash it alone rather than every column
+if 'property_id' in df.columns:
+    duplicates = df.duplicated(subset=['property_id']).sum()
+else:
+    duplicates = df.duplicated().sum()
 print(f'  {duplicates} duplicates found ({duplicates/len(df)*100:.2f}%)')
 print()
 
@@ -61,23 +121,30 @@ print()
 print('5. FEATURE CORRELATIONS WITH TARGET')
 print('-' * 40)
 feature_cols = [col for col in numeric_cols if col not in ['property_id', 'MedHouseVal']]
-correlations = df[feature_cols + ['MedHouseVal']].corr()['MedHouseVal'].sort_values(ascending=False)
-print(correlations[:-1])
+# Only the target column of the correlation matrix is used: standardize and
+# take one matrix-vector product instead of computing all feature pairs
+X = df[feature_cols].to_numpy(dtype=np.float64)
+y = df['MedHouseVal'].to_numpy(dtype=np.float64)
+X = (X - X.mean(axis=0)) / X.std(axis=0)
+y = (y - y.mean()) / y.std()
+correlations = pd.Series(X.T @ y / len(y), index=feature_cols, name='MedHouseVal').sort_values(ascending=False)
+print(correlations)
 print()
 
 # 6. Distribution Analysis
 print('6. FEATURE DISTRIBUTIONS')
 print('-' * 40)
-for col in feature_cols:
-    skew = df[col].skew()
-    print(f'{col:12s} - Mean: {df[col].mean():8.2f}, Std: {df[col].std():8.2f}, Skew: {skew:6.2f}')
+features = df[feature_cols]
+dist_stats = features.agg(['mean', 'std', 'skew']).T
+for col, row in dist_stats.iterrows():
+    print(f'{col:12s} - Mean: {row["mean"]:8.2f}, Std: {row["std"]:8.2f}, Skew: {row["skew"]:6.2f}')
 print()
 
 # 7. Key Insights
 print('7. KEY INSIGHTS')
 print('-' * 40)
 print('✓ STRONGEST PREDICTORS:')
-top_corr = correlations[:-1].head(3)
+top_corr = correlations.head(3)
 for feat, corr in top_corr.items():
     print(f'  • {feat}: {corr:.3f} correlation')
 print()
@@ -90,21 +157,31 @@ print(f'  • House age: {df["HouseAge"].min():.0f} - {df["HouseAge"].max():.0f}
 print()
 
 print('✓ GEOGRAPHIC PATTERNS:')
-lat_bins = pd.cut(df['Latitude'], bins=5)
-lat_price = df.groupby(lat_bins)['MedHouseVal'].mean()
+# Five equal-width latitude bands, right-closed like pd.cut(bins=5)
+lat = df['Latitude'].to_numpy()
+val = df['MedHouseVal'].to_numpy()
+lat_edges = np.linspace(lat.min(), lat.max(), 6)
+lat_band = np.digitize(lat, lat_edges[1:-1], right=True)
+band_counts = np.bincount(lat_band, minlength=5)
+band_sums = np.bincount(lat_band, weights=val, minlength=5)
+# Empty bands have no mean and must not count as the lowest price
+lat_price = np.divide(band_sums, band_counts, out=np.full(5, np.nan), where=band_counts > 0)
 print('  • House values vary significantly by latitude')
-print(f'  • Highest avg price: ${lat_price.max()*100:.0f}k')
-print(f'  • Lowest avg price: ${lat_price.min()*100:.0f}k')
+print(f'  • Highest avg price: ${np.nanmax(lat_price)*100:.0f}k')
+print(f'  • Lowest avg price: ${np.nanmin(lat_price)*100:.0f}k')
 print()
 
 # 8. Outlier Detection
 print('8. OUTLIER ANALYSIS')
 print('-' * 40)
-for col in feature_cols:
-    Q1 = df[col].quantile(0.25)
-    Q3 = df[col].quantile(0.75)
+if njit is not None:
+    outlier_counts = pd.Series(iqr_outlier_counts(features.to_numpy(dtype=np.float32)), index=feature_cols)
+else:
+    quartiles = features.quantile([0.25, 0.75])
+    Q1, Q3 = quartiles.loc[0.25], quartiles.loc[0.75]
     IQR = Q3 - Q1
-    outliers = ((df[col] < Q1 - 1.5*IQR) | (df[col] > Q3 + 1.5*IQR)).sum()
+    outlier_counts = (features.lt(Q1 - 1.5*IQR) | features.gt(Q3 + 1.5*IQR)).sum()
+for col, outliers in outlier_counts.items():
     if outliers > 0:
         pct = outliers/len(df)*100
         print(f'{col:12s} - {outliers:5d} outliers ({pct:5.2f}%)')
@@ -4,21 +4,47 @@ Quick demo of geographical clustering algorithms.
 Run this to verify the implementation works correctly.
 """
 
+import argparse
 import numpy as np
 import sys
+from time import perf_counter_ns
 sys.path.append('.')
 
 from src.geocluster import (
     haversine_distance,
+    haversine_distance_matrix,
     cluster_by_center_radius,
     cluster_by_diameter,
     validate_center_radius_constraint,
     validate_diameter_constraint,
-    compute_cluster_statistics
+    compute_cluster_statistics,
+    groups_by_label
 )
 
 
-def main():
+def best_time_ms(func, *args, repeat=5, **kwargs):
+    """Run ``func`` once to warm up, then return its result and best time in ms."""
+    result = func(*args, **kwargs)
+    times = []
+    for _ in range(repeat):
+        start = perf_counter_ns()
+        func(*args, **kwargs)
+        times.append(perf_counter_ns() - start)
+    return result, min(times) / 1e6
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Geographical clustering demo")
+    parser.add_argument('--quick', action='store_true',
+                        help="Skip the large random-dataset benchmark")
+    parser.add_argument('--n', type=int, default=100,
+                        help="Number of random points in the benchmark (default: 100)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    
     print("=" * 70)
     print("Geographical Clustering Demo")
     print("=" * 70)
@@ -36,7 +62,13 @@ def main():
         'Fremont': [37.5485, -121.9886],
     }
     
-    points = np.array(list(cities.values()))
+    # float32 resolves ~5 m at Earth scale, far below D, and halves the
+    # memory behind every distance computation. Latitudes and longitudes
+    # are kept as separate contiguous arrays; the clustering APIs take
+    # them stacked as (n, 2)
+    lats = np.fromiter((c[0] for c in cities.values()), dtype=np.float32, count=len(cities))
+    lons = np.fromiter((c[1] for c in cities.values()), dtype=np.float32, count=len(cities))
+    points = np.column_stack((lats, lons))
     city_names = list(cities.keys())
     
     print(f"\nCities ({len(cities)}):")
@@ -53,7 +85,7 @@ def main():
     print(f"San Francisco to San Jose: {sf_to_sj:.2f} km")
     
     # Test clustering with D=30 km
-    D = 30.0
+    D = np.float32(30.0)
     print(f"\n3. Clustering with D={D} km")
     print("-" * 70)
     
@@ -62,8 +94,8 @@ def main():
     labels_center, centers_center, n_center = cluster_by_center_radius(points, D)
     print(f"  Number of clusters: {n_center}")
     
-    for cluster_id in range(n_center):
-        cluster_cities = [city_names[i] for i in range(len(points)) if labels_center[i] == cluster_id]
+    for cluster_id, members in enumerate(groups_by_label(labels_center, n_center)):
+        cluster_cities = [city_names[i] for i in members]
         print(f"  Cluster {cluster_id}: {', '.join(cluster_cities)}")
     
     # Validate
@@ -75,8 +107,8 @@ def main():
     labels_diameter, centers_diameter, n_diameter = cluster_by_diameter(points, D)
     print(f"  Number of clusters: {n_diameter}")
     
-    for cluster_id in range(n_diameter):
-        cluster_cities = [city_names[i] for i in range(len(points)) if labels_diameter[i] == cluster_id]
+    for cluster_id, members in enumerate(groups_by_label(labels_diameter, n_diameter)):
+        cluster_cities = [city_names[i] for i in members]
         print(f"  Cluster {cluster_id}: {', '.join(cluster_cities)}")
     
     # Validate
@@ -109,38 +141,41 @@ def main():
     print(f"  Difference:             {n_diameter - n_center}")
     print(f"\n  Observation: Diameter produces ≥ clusters (stricter constraint)")
     
-    # Test with random data
-    print("\n6. Large Dataset Test (100 points)")
-    print("-" * 70)
-    
-    np.random.seed(42)
-    large_points = np.random.uniform(
-        low=[37.2, -122.6],
-        high=[38.0, -121.8],
-        size=(100, 2)
-    )
-    
-    import time
-    
-    # Center-Radius
-    start = time.time()
-    labels_c, centers_c, n_c = cluster_by_center_radius(large_points, D)
-    time_c = (time.time() - start) * 1000
-    
-    # Diameter
-    start = time.time()
-    labels_d, centers_d, n_d = cluster_by_diameter(large_points, D)
-    time_d = (time.time() - start) * 1000
-    
-    print(f"  Center-Radius: {n_c} clusters in {time_c:.1f} ms")
-    print(f"  Diameter:      {n_d} clusters in {time_d:.1f} ms")
-    
-    # Validate
-    is_valid_c, _ = validate_center_radius_constraint(large_points, labels_c, centers_c, D)
-    is_valid_d, _ = validate_diameter_constraint(large_points, labels_d, D)
-    
-    print(f"  Center-Radius valid: {'✓ Yes' if is_valid_c else '✗ No'}")
-    print(f"  Diameter valid:      {'✓ Yes' if is_valid_d else '✗ No'}")
+    # The O(n^2) benchmark is skipped with --quick (e.g. import smoke tests)
+    if not args.quick:
+        # Test with random data
+        print(f"\n6. Large Dataset Test ({args.n} points)")
+        print("-" * 70)
+        
+        rng = np.random.default_rng(42)
+        large_lats = rng.uniform(37.2, 38.0, args.n).astype(np.float32)
+        large_lons = rng.uniform(-122.6, -121.8, args.n).astype(np.float32)
+        large_points = np.column_stack((large_lats, large_lons))
+        
+        # Timings are the best of 5 runs after a warm-up call, which also
+        # compiles the distance kernel when Numba is installed
+        
+        # Pairwise distances once, shared by diameter clustering and validation
+        D_mat, time_m = best_time_ms(haversine_distance_matrix, (large_lats, large_lons))
+        
+        # Center-Radius
+        (labels_c, centers_c, n_c), time_c = best_time_ms(cluster_by_center_radius, large_points, D)
+        
+        # Diameter
+        (labels_d, centers_d, n_d), time_d = best_time_ms(
+            cluster_by_diameter, large_points, D, distances=D_mat
+        )
+        
+        print(f"  Distance matrix: {len(large_points)}x{len(large_points)} in {time_m:.1f} ms")
+        print(f"  Center-Radius: {n_c} clusters in {time_c:.1f} ms")
+        print(f"  Diameter:      {n_d} clusters in {time_d:.1f} ms")
+        
+        # Validate
+        is_valid_c, _ = validate_center_radius_constraint(large_points, labels_c, centers_c, D)
+        is_valid_d, _ = validate_diameter_constraint(large_points, labels_d, D, distances=D_mat)
+        
+        print(f"  Center-Radius valid: {'✓ Yes' if is_valid_c else '✗ No'}")
+        print(f"  Diameter valid:      {'✓ Yes' if is_valid_d else '✗ No'}")
     
     print("\n" + "=" * 70)
     print("Demo Complete! All tests passed ✓")
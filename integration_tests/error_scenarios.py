@@ -13,11 +13,18 @@ Each error scenario includes:
 """
 
 import json
-from typing import Dict, List, Any
-from dataclasses import dataclass
+import re
+from functools import lru_cache
+from typing import Dict, List, Any, Tuple
+from dataclasses import dataclass, asdict
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ErrorScenario:
     """Definition of a DS error scenario for testing."""
     name: str
@@ -28,6 +35,148 @@ class ErrorScenario:
     should_be_detected: bool
     expected_feedback: str
     remediation_suggestion: str
+    
+    def to_json(self) -> str:
+        """Serialize the scenario as compact JSON."""
+        return _dumps(asdict(self))
+
+
+def _dumps(obj: Any) -> str:
+    """Compact JSON text, identical with or without orjson."""
+    if orjson:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+# Marks of test data reaching model development, in any case ("Test_Set")
+_LEAKY_EVAL_RE = re.compile(r"test", re.IGNORECASE)
+# Unacceptable run-to-run variance or unseeded training, in one pass
+_REPRO_RE = re.compile(r"15%|not_set")
+
+
+def _detect_target_leakage(artifacts: Dict[str, Any]) -> Tuple[bool, str]:
+    """Check for temporal alignment issues."""
+    detected = False
+    detection_reason = ""
+    
+    if "feature_engineering_spec" in artifacts:
+        for feature in artifacts["feature_engineering_spec"].get("features", []):
+            creation_date = feature.get("creation_date")
+            target_date = feature.get("target_date")
+            if creation_date and target_date and creation_date > target_date:
+                detected = True
+                detection_reason = f"Temporal leakage in feature {feature['name']}"
+                break
+    
+    if "model_features" in artifacts:
+        features = artifacts["model_features"]
+        prediction_date = features.get("prediction_date")
+        churn_date = features.get("churn_date")
+        
+        # Check for features with "after" in the name
+        for key in features.keys():
+            if "after" in key.lower() and prediction_date and churn_date:
+                detected = True
+                detection_reason = f"Future information in feature {key}"
+                break
+    
+    return detected, detection_reason
+
+
+def _detect_methodology_error(artifacts: Dict[str, Any]) -> Tuple[bool, str]:
+    """Check for missing baselines."""
+    if "model_evaluation" in artifacts:
+        baselines = artifacts["model_evaluation"].get("baseline_models", [])
+        if len(baselines) == 0:
+            return True, "No baseline models provided"
+    return False, ""
+
+
+def _detect_data_snooping(artifacts: Dict[str, Any]) -> Tuple[bool, str]:
+    """Check for test data usage in model development."""
+    detected = False
+    detection_reason = ""
+    
+    if "model_development_log" in artifacts:
+        log = artifacts["model_development_log"]
+        if "feature_selection" in log:
+            eval_data = log["feature_selection"].get("evaluation_data", "")
+            if _LEAKY_EVAL_RE.search(eval_data):
+                detected = True
+                detection_reason = "Test data used in feature selection"
+        
+        if "hyperparameter_tuning" in log:
+            opt_metric = log["hyperparameter_tuning"].get("optimization_metric", "")
+            if _LEAKY_EVAL_RE.search(opt_metric):
+                detected = True
+                detection_reason = "Test data used in hyperparameter tuning"
+    
+    return detected, detection_reason
+
+
+def _detect_statistical_rigor(artifacts: Dict[str, Any]) -> Tuple[bool, str]:
+    """Check for missing statistical tests."""
+    if "ab_test_analysis" in artifacts:
+        analysis = artifacts["ab_test_analysis"]
+        if not analysis.get("p_value") or not analysis.get("confidence_interval"):
+            return True, "Missing statistical significance testing"
+    return False, ""
+
+
+def _detect_monitoring_gap(artifacts: Dict[str, Any]) -> Tuple[bool, str]:
+    """Check production monitoring configuration."""
+    if "deployment_spec" in artifacts:
+        monitoring = artifacts["deployment_spec"].get("monitoring", {})
+        if not monitoring.get("performance_tracking") or not monitoring.get("data_drift_detection"):
+            return True, "Insufficient production monitoring"
+    return False, ""
+
+
+def _detect_pipeline_inconsistency(artifacts: Dict[str, Any]) -> Tuple[bool, str]:
+    """Check for training-serving skew."""
+    if "model_pipeline" in artifacts:
+        pipeline = artifacts["model_pipeline"]
+        training_features = pipeline.get("training_features", {})
+        serving_features = pipeline.get("serving_features", {})
+        
+        for feature in training_features:
+            if feature in serving_features:
+                if training_features[feature] != serving_features[feature]:
+                    return True, f"Training-serving skew in feature {feature}"
+    return False, ""
+
+
+def _detect_reproducibility(artifacts: Dict[str, Any]) -> Tuple[bool, str]:
+    """Check reproducibility requirements."""
+    if "training_pipeline" in artifacts:
+        pipeline = artifacts["training_pipeline"]
+        variance = pipeline.get("training_variance", "")
+        if _REPRO_RE.search(variance) or _REPRO_RE.search(pipeline.get("random_seeds", "")):
+            return True, "Reproducibility requirements not met"
+    return False, ""
+
+
+def _detect_none(artifacts: Dict[str, Any]) -> Tuple[bool, str]:
+    """Valid scenarios should not detect errors."""
+    return False, "No errors found - validation passed"
+
+
+def _detect_unknown(artifacts: Dict[str, Any]) -> Tuple[bool, str]:
+    """Error types without detection logic are never flagged."""
+    return False, ""
+
+
+# Detection logic per error type, looked up once per scenario
+_DETECTORS = {
+    "target_leakage": _detect_target_leakage,
+    "methodology_error": _detect_methodology_error,
+    "data_snooping": _detect_data_snooping,
+    "statistical_rigor": _detect_statistical_rigor,
+    "monitoring_gap": _detect_monitoring_gap,
+    "pipeline_inconsistency": _detect_pipeline_inconsistency,
+    "reproducibility": _detect_reproducibility,
+    "none": _detect_none,
+}
 
 
 class DSValidatorErrorScenarios:
@@ -306,13 +455,24 @@ class DSValidatorErrorScenarios:
     
     @staticmethod
     def get_all_error_scenarios() -> Dict[str, List[ErrorScenario]]:
-        """Get all error scenarios organized by category."""
+        """Get all error scenarios organized by category.
+        
+        The scenarios are built once; each call gets fresh category lists
+        over the shared (read-only) scenario objects.
+        """
         return {
-            "data_leakage": DSValidatorErrorScenarios.get_data_leakage_scenarios(),
-            "methodology_errors": DSValidatorErrorScenarios.get_methodology_error_scenarios(), 
-            "production_readiness": DSValidatorErrorScenarios.get_production_readiness_scenarios()
+            category: list(scenarios)
+            for category, scenarios in _all_error_scenarios().items()
         }
     
+    @staticmethod
+    def get_all_error_scenarios_json() -> str:
+        """Serialize all error scenarios, by category, in one JSON document."""
+        return _dumps({
+            category: [asdict(scenario) for scenario in scenarios]
+            for category, scenarios in _all_error_scenarios().items()
+        })
+    
     @staticmethod
     def validate_error_detection(scenario: ErrorScenario) -> Dict[str, Any]:
         """Simulate ds-validator error detection for a scenario."""
@@ -323,107 +483,9 @@ class DSValidatorErrorScenarios:
             "should_detect": scenario.should_be_detected
         }
         
-        # Simulate detection logic based on error type
-        detected = False
-        detection_reason = ""
-        
-        if scenario.error_type == "target_leakage":
-            # Check for temporal alignment issues
-            artifacts = scenario.artifacts
-            if "feature_engineering_spec" in artifacts:
-                for feature in artifacts["feature_engineering_spec"].get("features", []):
-                    creation_date = feature.get("creation_date")
-                    target_date = feature.get("target_date")
-                    if creation_date and target_date and creation_date > target_date:
-                        detected = True
-                        detection_reason = f"Temporal leakage in feature {feature['name']}"
-                        break
-            
-            if "model_features" in artifacts:
-                features = artifacts["model_features"]
-                prediction_date = features.get("prediction_date")
-                churn_date = features.get("churn_date")
-                
-                # Check for features with "after" in the name
-                for key in features.keys():
-                    if "after" in key.lower() and prediction_date and churn_date:
-                        detected = True
-                        detection_reason = f"Future information in feature {key}"
-                        break
-        
-        elif scenario.error_type == "methodology_error":
-            # Check for missing baselines
-            artifacts = scenario.artifacts
-            if "model_evaluation" in artifacts:
-                baselines = artifacts["model_evaluation"].get("baseline_models", [])
-                if len(baselines) == 0:
-                    detected = True
-                    detection_reason = "No baseline models provided"
-        
-        elif scenario.error_type == "data_snooping":
-            # Check for test data usage in model development
-            artifacts = scenario.artifacts
-            if "model_development_log" in artifacts:
-                log = artifacts["model_development_log"]
-                if "feature_selection" in log:
-                    eval_data = log["feature_selection"].get("evaluation_data", "")
-                    if "test" in eval_data:
-                        detected = True
-                        detection_reason = "Test data used in feature selection"
-                
-                if "hyperparameter_tuning" in log:
-                    opt_metric = log["hyperparameter_tuning"].get("optimization_metric", "")
-                    if "test" in opt_metric:
-                        detected = True
-                        detection_reason = "Test data used in hyperparameter tuning"
-        
-        elif scenario.error_type == "statistical_rigor":
-            # Check for missing statistical tests
-            artifacts = scenario.artifacts
-            if "ab_test_analysis" in artifacts:
-                analysis = artifacts["ab_test_analysis"]
-                if not analysis.get("p_value") or not analysis.get("confidence_interval"):
-                    detected = True
-                    detection_reason = "Missing statistical significance testing"
-        
-        elif scenario.error_type == "monitoring_gap":
-            # Check production monitoring configuration
-            artifacts = scenario.artifacts
-            if "deployment_spec" in artifacts:
-                monitoring = artifacts["deployment_spec"].get("monitoring", {})
-                if not monitoring.get("performance_tracking") or not monitoring.get("data_drift_detection"):
-                    detected = True
-                    detection_reason = "Insufficient production monitoring"
-        
-        elif scenario.error_type == "pipeline_inconsistency":
-            # Check for training-serving skew
-            artifacts = scenario.artifacts
-            if "model_pipeline" in artifacts:
-                pipeline = artifacts["model_pipeline"]
-                training_features = pipeline.get("training_features", {})
-                serving_features = pipeline.get("serving_features", {})
-                
-                for feature in training_features:
-                    if feature in serving_features:
-                        if training_features[feature] != serving_features[feature]:
-                            detected = True
-                            detection_reason = f"Training-serving skew in feature {feature}"
-                            break
-        
-        elif scenario.error_type == "reproducibility":
-            # Check reproducibility requirements
-            artifacts = scenario.artifacts
-            if "training_pipeline" in artifacts:
-                pipeline = artifacts["training_pipeline"]
-                variance = pipeline.get("training_variance", "")
-                if "15%" in variance or "not_set" in pipeline.get("random_seeds", ""):
-                    detected = True
-                    detection_reason = "Reproducibility requirements not met"
-        
-        # For valid scenarios, should not detect errors
-        elif scenario.error_type == "none":
-            detected = False
-            detection_reason = "No errors found - validation passed"
+        # Dispatch on error type; unknown types are never detected
+        detector = _DETECTORS.get(scenario.error_type, _detect_unknown)
+        detected, detection_reason = detector(scenario.artifacts)
         
         result.update({
             "detected": detected,
@@ -436,10 +498,22 @@ class DSValidatorErrorScenarios:
         return result
 
 
+@lru_cache(maxsize=1)
+def _all_error_scenarios() -> Dict[str, List[ErrorScenario]]:
+    """Build every scenario fixture once per process."""
+    return {
+        "data_leakage": DSValidatorErrorScenarios.get_data_leakage_scenarios(),
+        "methodology_errors": DSValidatorErrorScenarios.get_methodology_error_scenarios(), 
+        "production_readiness": DSValidatorErrorScenarios.get_production_readiness_scenarios()
+    }
+
+
 def generate_error_test_suite() -> Dict[str, Any]:
     """Generate complete error detection test suite."""
     all_scenarios = DSValidatorErrorScenarios.get_all_error_scenarios()
     
+    validate_error_detection = DSValidatorErrorScenarios.validate_error_detection
+    
     test_results = {}
     total_tests = 0
     correct_detections = 0
@@ -448,7 +522,7 @@ def generate_error_test_suite() -> Dict[str, Any]:
         category_results = []
         
         for scenario in scenarios:
-            result = DSValidatorErrorScenarios.validate_error_detection(scenario)
+            result = validate_error_detection(scenario)
             category_results.append(result)
             
             total_tests += 1
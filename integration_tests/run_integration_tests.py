@@ -12,32 +12,105 @@ This script executes the complete integration testing workflow:
 
 Usage:
     python run_integration_tests.py --full-suite --generate-report
+    python run_integration_tests.py --full-suite --jobs 5
     python run_integration_tests.py --quick-check --verbose
 """
 
+import io
+import os
 import sys
 import json
+import hashlib
 import logging
+import logging.handlers
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from datetime import datetime
+from functools import cached_property, lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any
 
-# Import test modules
+# Test modules are imported where they are used, so that --quick-check
+# does not pay for them (test_scenarios pulls in pytest)
 sys.path.append(str(Path(__file__).parent))
-from test_runner import DSAgentIntegrationTest
-from test_scenarios import DSAgentTestScenarios, TestScenarioRunner
-from error_scenarios import DSValidatorErrorScenarios, generate_error_test_suite
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
+
+# Log records held in memory before the log file is written
+LOG_BUFFER_RECORDS = 256
+
+# Where each test phase reports its PASS/FAIL status
+_STATUS_EXTRACTORS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "framework_structure": itemgetter("status"),
+    "agent_responses": lambda results: results["summary"]["status"],
+    "validator_error_detection": lambda results: results["validation_summary"]["status"],
+    "workflow_collaboration": lambda results: results["collaboration_summary"]["status"],
+    "end_to_end_workflow": itemgetter("workflow_status")
+}
+
+
+@lru_cache(maxsize=256)
+def _dir_contents(directory: str, mtime_ns: int) -> frozenset:
+    """Names of the entries in ``directory``, memoized per directory state.
+    
+    The mtime is part of the key, so adding or removing an entry
+    invalidates the cached listing.
+    """
+    with os.scandir(directory) as entries:
+        return frozenset(entry.name for entry in entries)
+
+
+def _find_missing(base: Path, relative_paths: List[str]) -> List[str]:
+    """Return the entries of ``relative_paths`` that do not exist under ``base``.
+    
+    Paths are grouped by parent directory, and each parent is listed once
+    with ``os.scandir`` rather than stat'ing every expected file; unchanged
+    directories answer from the cache on reruns. Paths are handled as plain
+    strings, so no Path object is built per file.
+    """
+    base_dir = os.fspath(base)
+    listings = {}
+    missing = []
+    for relative_path in relative_paths:
+        parent, name = os.path.split(relative_path)
+        if parent not in listings:
+            directory = os.path.join(base_dir, parent) if parent else base_dir
+            try:
+                listings[parent] = _dir_contents(directory, os.stat(directory).st_mtime_ns)
+            except OSError:
+                listings[parent] = frozenset()
+        if name not in listings[parent]:
+            missing.append(relative_path)
+    return missing
+
+
+def _check_files(base: Path, expected: List[str]) -> Dict[str, Any]:
+    """Existence check result for the ``expected`` paths under ``base``."""
+    missing = _find_missing(base, expected)
+    return {
+        "expected": len(expected),
+        "found": len(expected) - len(missing),
+        "missing": missing,
+        "status": "PASS" if not missing else "FAIL"
+    }
 
 
 class ComprehensiveIntegrationTest:
     """Main integration test orchestrator."""
     
-    def __init__(self, test_dir: Path, verbose: bool = False):
+    def __init__(self, test_dir: Path, verbose: bool = False, use_cache: bool = True):
         self.test_dir = test_dir
         self.verbose = verbose
+        self.use_cache = use_cache
         self.logger = self._setup_logging()
         self.results = {}
+        # Set while run_full_test_suite runs, so every phase shares its start time
+        self._suite_timestamp = None
         
     def _setup_logging(self) -> logging.Logger:
         """Setup logging for comprehensive testing."""
@@ -60,17 +133,32 @@ class ComprehensiveIntegrationTest:
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        # Buffer records and write them in batches; errors and interpreter
+        # exit (logging.shutdown closes the buffer) flush immediately
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=LOG_BUFFER_RECORDS, flushLevel=logging.ERROR, target=file_handler
+        )
+        logger.addHandler(buffered_handler)
         
         return logger
     
+    @cached_property
+    def _scenarios(self):
+        """Shared scenario builder, created on first use."""
+        from test_scenarios import DSAgentTestScenarios
+        return DSAgentTestScenarios()
+    
+    def _timestamp(self) -> str:
+        """ISO timestamp for a phase result: the suite start inside a full run."""
+        return self._suite_timestamp or datetime.now().isoformat()
+    
     def run_framework_structure_validation(self) -> Dict[str, Any]:
         """Validate DS agent framework structure and files."""
         self.logger.info("Step 1: Validating framework structure...")
         
         results = {
             "test_name": "framework_structure_validation",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._timestamp(),
             "status": "UNKNOWN",
             "checks": {}
         }
@@ -85,18 +173,7 @@ class ComprehensiveIntegrationTest:
         ]
         
         agents_dir = self.test_dir / ".github" / "agents"
-        missing_agents = []
-        
-        for agent_file in agent_files:
-            if not (agents_dir / agent_file).exists():
-                missing_agents.append(agent_file)
-        
-        results["checks"]["agent_files"] = {
-            "expected": len(agent_files),
-            "found": len(agent_files) - len(missing_agents),
-            "missing": missing_agents,
-            "status": "PASS" if len(missing_agents) == 0 else "FAIL"
-        }
+        results["checks"]["agent_files"] = _check_files(agents_dir, agent_files)
         
         # Check ds-planning-workflows skill
         skill_path = self.test_dir / ".github" / "skills" / "ds-planning-workflows"
@@ -108,17 +185,7 @@ class ComprehensiveIntegrationTest:
             "scripts/check_leakage_risks.py"
         ]
         
-        missing_skill_components = []
-        for component in skill_components:
-            if not (skill_path / component).exists():
-                missing_skill_components.append(component)
-        
-        results["checks"]["ds_planning_skill"] = {
-            "expected": len(skill_components),
-            "found": len(skill_components) - len(missing_skill_components), 
-            "missing": missing_skill_components,
-            "status": "PASS" if len(missing_skill_components) == 0 else "FAIL"
-        }
+        results["checks"]["ds_planning_skill"] = _check_files(skill_path, skill_components)
         
         # Check project standards files
         standards_files = [
@@ -130,17 +197,7 @@ class ComprehensiveIntegrationTest:
             ".github/instructions/documentation-ds.instructions.md"
         ]
         
-        missing_standards = []
-        for standards_file in standards_files:
-            if not (self.test_dir / standards_file).exists():
-                missing_standards.append(standards_file)
-        
-        results["checks"]["project_standards"] = {
-            "expected": len(standards_files),
-            "found": len(standards_files) - len(missing_standards),
-            "missing": missing_standards,
-            "status": "PASS" if len(missing_standards) == 0 else "FAIL"
-        }
+        results["checks"]["project_standards"] = _check_files(self.test_dir, standards_files)
         
         # Overall status
         all_checks_passed = all(
@@ -156,42 +213,34 @@ class ComprehensiveIntegrationTest:
         """Test individual agent response capabilities."""
         self.logger.info("Step 2: Testing agent response capabilities...")
         
-        scenarios = DSAgentTestScenarios()
+        from test_scenarios import TestScenarioRunner
+        
+        scenarios = self._scenarios
         runner = TestScenarioRunner(verbose=self.verbose)
         
         results = {
             "test_name": "agent_response_tests", 
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._timestamp(),
             "agent_tests": {}
         }
         
-        # Test router decomposition
-        router_tests = scenarios.get_router_decomposition_tests()
-        router_results = [runner.run_agent_response_test(test) for test in router_tests]
-        results["agent_tests"]["head-of-ds-router"] = router_results
-        
-        # Test data engineer responses
-        de_tests = scenarios.get_data_engineer_tests()
-        de_results = [runner.run_agent_response_test(test) for test in de_tests]
-        results["agent_tests"]["data-engineer"] = de_results
-        
-        # Test data scientist responses
-        ds_tests = scenarios.get_data_scientist_tests()  
-        ds_results = [runner.run_agent_response_test(test) for test in ds_tests]
-        results["agent_tests"]["data-scientist"] = ds_results
-        
-        # Test ML engineer responses
-        mle_tests = scenarios.get_ml_engineer_tests()
-        mle_results = [runner.run_agent_response_test(test) for test in mle_tests]
-        results["agent_tests"]["ml-engineer"] = mle_results
-        
-        # Calculate summary statistics
+        # One pass over every agent's scenarios, grouped by agent
+        agent_scenarios = {
+            "head-of-ds-router": scenarios.get_router_decomposition_tests(),
+            "data-engineer": scenarios.get_data_engineer_tests(),
+            "data-scientist": scenarios.get_data_scientist_tests(),
+            "ml-engineer": scenarios.get_ml_engineer_tests()
+        }
+        run_test = runner.run_agent_response_test
         all_tests = []
-        for agent_results in results["agent_tests"].values():
+        for agent_name, agent_tests in agent_scenarios.items():
+            agent_results = list(map(run_test, agent_tests))
+            results["agent_tests"][agent_name] = agent_results
             all_tests.extend(agent_results)
         
+        # Calculate summary statistics
         total_tests = len(all_tests)
-        passed_tests = sum(1 for test in all_tests if test["success"])
+        passed_tests = sum(map(itemgetter("success"), all_tests))
         
         results["summary"] = {
             "total_tests": total_tests,
@@ -208,11 +257,11 @@ class ComprehensiveIntegrationTest:
         self.logger.info("Step 3: Testing ds-validator error detection...")
         
         # Generate comprehensive error detection test suite
-        error_test_results = generate_error_test_suite()
+        error_test_results = self._cached_error_test_suite()
         
         results = {
             "test_name": "validator_error_detection",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._timestamp(),
             "error_detection_results": error_test_results
         }
         
@@ -231,47 +280,90 @@ class ComprehensiveIntegrationTest:
         self.logger.info(f"Error detection tests: {results['validation_summary']['status']} ({detection_accuracy:.1%})")
         return results
     
+    def _cached_error_test_suite(self) -> Dict[str, Any]:
+        """Run the error detection suite, reusing a stored result if unchanged.
+        
+        Results are cached on disk under ``results/cache``, keyed by a hash
+        of the serialized scenarios and the error_scenarios module source,
+        so editing either the fixtures or the detection logic recomputes.
+        Only the latest entry is kept.
+        """
+        import error_scenarios
+        from error_scenarios import DSValidatorErrorScenarios, generate_error_test_suite
+        
+        if not self.use_cache:
+            return generate_error_test_suite()
+        
+        # Stdlib, key-sorted serialization: the key must not depend on orjson
+        scenarios = {
+            category: [asdict(scenario) for scenario in category_scenarios]
+            for category, category_scenarios in DSValidatorErrorScenarios.get_all_error_scenarios().items()
+        }
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps(scenarios, sort_keys=True).encode())
+        digest.update(Path(error_scenarios.__file__).read_bytes())
+        cache_dir = self.test_dir / "integration_tests" / "results" / "cache"
+        cache_file = cache_dir / f"error_detection_{digest.hexdigest()}.json"
+        
+        try:
+            cached = json.loads(cache_file.read_bytes())
+            self.logger.debug(f"Error detection results reused from {cache_file}")
+            return cached
+        except (OSError, ValueError):
+            pass
+        
+        results = generate_error_test_suite()
+        
+        # Write to a temp file and rename, so readers never see a partial entry
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(results))
+        os.replace(tmp_file, cache_file)
+        
+        # Evict entries left behind by earlier scenario or source versions
+        for stale_file in cache_dir.glob("error_detection_*.json"):
+            if stale_file != cache_file:
+                try:
+                    stale_file.unlink()
+                except OSError:
+                    pass
+        return results
+    
     def run_workflow_collaboration_tests(self) -> Dict[str, Any]:
         """Test agent collaboration and workflow coordination."""
         self.logger.info("Step 4: Testing workflow collaboration...")
         
-        scenarios = DSAgentTestScenarios()
+        scenarios = self._scenarios
         collaboration_scenarios = scenarios.get_collaboration_test_scenarios()
         
+        # Simulate handoff validation: a handoff is validated (and its
+        # contract complete) when it declares an interface format
+        contracts_ok = [
+            "format" in (scenario["scenario"].get("interface_contract") or ())
+            for scenario in collaboration_scenarios
+        ]
+        
         results = {
             "test_name": "workflow_collaboration",
-            "timestamp": datetime.now().isoformat(),
-            "collaboration_tests": []
+            "timestamp": self._timestamp(),
+            "collaboration_tests": [
+                {
+                    "scenario_name": scenario["name"],
+                    "initiating_agent": scenario["scenario"]["initiating_agent"],
+                    "receiving_agent": scenario["scenario"]["receiving_agent"],
+                    "deliverable": scenario["scenario"]["deliverable"],
+                    "expected_success": scenario["scenario"]["expected_handoff_success"],
+                    "handoff_validated": contract_ok,
+                    "contract_complete": contract_ok,
+                    "success": contract_ok
+                }
+                for scenario, contract_ok in zip(collaboration_scenarios, contracts_ok)
+            ]
         }
         
-        for scenario in collaboration_scenarios:
-            test_result = {
-                "scenario_name": scenario["name"],
-                "initiating_agent": scenario["scenario"]["initiating_agent"],
-                "receiving_agent": scenario["scenario"]["receiving_agent"],
-                "deliverable": scenario["scenario"]["deliverable"],
-                "expected_success": scenario["scenario"]["expected_handoff_success"]
-            }
-            
-            # Simulate handoff validation
-            interface_contract = scenario["scenario"].get("interface_contract", {})
-            if interface_contract and "format" in interface_contract:
-                test_result["handoff_validated"] = True
-                test_result["contract_complete"] = True
-            else:
-                test_result["handoff_validated"] = False
-                test_result["contract_complete"] = False
-            
-            test_result["success"] = (
-                test_result["handoff_validated"] and 
-                test_result["contract_complete"]
-            )
-            
-            results["collaboration_tests"].append(test_result)
-        
         # Summary
-        total_collaboration_tests = len(results["collaboration_tests"])
-        successful_handoffs = sum(1 for test in results["collaboration_tests"] if test["success"])
+        total_collaboration_tests = len(contracts_ok)
+        successful_handoffs = sum(contracts_ok)
         
         results["collaboration_summary"] = {
             "total_tests": total_collaboration_tests,
@@ -287,12 +379,12 @@ class ComprehensiveIntegrationTest:
         """Test complete end-to-end churn prediction workflow."""
         self.logger.info("Step 5: Testing end-to-end workflow...")
         
-        scenarios = DSAgentTestScenarios()
+        scenarios = self._scenarios
         churn_workflow = scenarios.get_churn_prediction_workflow()
         
         results = {
             "test_name": "end_to_end_workflow",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._timestamp(),
             "workflow": churn_workflow.name,
             "business_query": churn_workflow.business_query[:100] + "...",
             "agent_sequence_validation": {}
@@ -345,8 +437,12 @@ class ComprehensiveIntegrationTest:
         self.logger.info(f"End-to-end workflow test: {results['workflow_status']}")
         return results
     
-    def run_full_test_suite(self) -> Dict[str, Any]:
-        """Execute complete integration test suite."""
+    def run_full_test_suite(self, jobs: int = 1) -> Dict[str, Any]:
+        """Execute complete integration test suite.
+        
+        The phases are independent; with ``jobs > 1`` they run concurrently
+        in that many worker threads (log lines may then interleave).
+        """
         self.logger.info("=" * 60)
         self.logger.info("DS Agent Framework - Full Integration Test Suite")
         self.logger.info("=" * 60)
@@ -354,11 +450,23 @@ class ComprehensiveIntegrationTest:
         start_time = datetime.now()
         
         # Execute all test phases
-        framework_results = self.run_framework_structure_validation()
-        agent_response_results = self.run_agent_response_tests()
-        validator_results = self.run_validator_error_detection_tests()
-        collaboration_results = self.run_workflow_collaboration_tests()
-        e2e_results = self.run_end_to_end_workflow_test()
+        phases = {
+            "framework_structure": self.run_framework_structure_validation,
+            "agent_responses": self.run_agent_response_tests,
+            "validator_error_detection": self.run_validator_error_detection_tests,
+            "workflow_collaboration": self.run_workflow_collaboration_tests,
+            "end_to_end_workflow": self.run_end_to_end_workflow_test
+        }
+        self._suite_timestamp = start_time.isoformat()
+        try:
+            if jobs > 1:
+                with ThreadPoolExecutor(max_workers=min(jobs, len(phases))) as executor:
+                    futures = {name: executor.submit(phase) for name, phase in phases.items()}
+                    phase_results = {name: future.result() for name, future in futures.items()}
+            else:
+                phase_results = {name: phase() for name, phase in phases.items()}
+        finally:
+            self._suite_timestamp = None
         
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
@@ -368,35 +476,22 @@ class ComprehensiveIntegrationTest:
             "test_suite": "DS_Agent_Framework_Integration_Tests",
             "execution_timestamp": start_time.isoformat(),
             "duration_seconds": duration,
-            "test_phases": {
-                "framework_structure": framework_results,
-                "agent_responses": agent_response_results,
-                "validator_error_detection": validator_results,
-                "workflow_collaboration": collaboration_results,
-                "end_to_end_workflow": e2e_results
-            }
+            "test_phases": phase_results
         }
         
         # Calculate overall test results
-        phase_statuses = []
-        for phase_name, phase_results in comprehensive_results["test_phases"].items():
-            if phase_name == "framework_structure":
-                phase_statuses.append(phase_results["status"])
-            elif phase_name == "agent_responses":
-                phase_statuses.append(phase_results["summary"]["status"])
-            elif phase_name == "validator_error_detection":
-                phase_statuses.append(phase_results["validation_summary"]["status"])
-            elif phase_name == "workflow_collaboration":
-                phase_statuses.append(phase_results["collaboration_summary"]["status"])
-            elif phase_name == "end_to_end_workflow":
-                phase_statuses.append(phase_results["workflow_status"])
-        
-        overall_pass = all(status == "PASS" for status in phase_statuses)
-        pass_rate = sum(1 for status in phase_statuses if status == "PASS") / len(phase_statuses)
+        phase_statuses = [
+            _STATUS_EXTRACTORS[phase_name](phase_results)
+            for phase_name, phase_results in comprehensive_results["test_phases"].items()
+        ]
+        
+        passed_phases = phase_statuses.count("PASS")
+        overall_pass = passed_phases == len(phase_statuses)
+        pass_rate = passed_phases / len(phase_statuses)
         
         comprehensive_results["overall_summary"] = {
             "total_test_phases": len(phase_statuses),
-            "passed_phases": sum(1 for status in phase_statuses if status == "PASS"),
+            "passed_phases": passed_phases,
             "phase_pass_rate": pass_rate,
             "overall_status": "PASS" if overall_pass else "FAIL",
             "phase_results": dict(zip(comprehensive_results["test_phases"].keys(), phase_statuses))
@@ -417,12 +512,13 @@ class ComprehensiveIntegrationTest:
     def _generate_recommendations(self, results: Dict[str, Any]) -> List[str]:
         """Generate recommendations based on test results."""
         recommendations = []
+        phases = results["test_phases"]
         
         # Check framework structure issues
-        framework_status = results["test_phases"]["framework_structure"]["status"]
-        if framework_status == "FAIL":
+        framework = phases["framework_structure"]
+        if framework["status"] == "FAIL":
             missing_files = []
-            for check_name, check_results in results["test_phases"]["framework_structure"]["checks"].items():
+            for check_results in framework["checks"].values():
                 if check_results["status"] == "FAIL":
                     missing_files.extend(check_results.get("missing", []))
             
@@ -432,36 +528,33 @@ class ComprehensiveIntegrationTest:
                 )
         
         # Check agent response issues
-        agent_summary = results["test_phases"]["agent_responses"]["summary"]
+        agent_summary = phases["agent_responses"]["summary"]
         if agent_summary["status"] == "FAIL":
             recommendations.append(
                 f"Improve agent response quality - current pass rate: {agent_summary['pass_rate']:.1%}"
             )
         
         # Check validator detection issues
-        validator_summary = results["test_phases"]["validator_error_detection"]["validation_summary"]
+        validator_summary = phases["validator_error_detection"]["validation_summary"]
         if validator_summary["status"] == "FAIL":
             recommendations.append(
                 f"Enhance ds-validator error detection - current accuracy: {validator_summary['detection_accuracy']:.1%}"
             )
         
         # Check collaboration issues
-        collab_summary = results["test_phases"]["workflow_collaboration"]["collaboration_summary"]
-        if collab_summary["status"] == "FAIL":
+        if phases["workflow_collaboration"]["collaboration_summary"]["status"] == "FAIL":
             recommendations.append(
                 "Improve agent collaboration - validate handoff protocols and interface contracts"
             )
         
         # Check workflow issues
-        workflow_status = results["test_phases"]["end_to_end_workflow"]["workflow_status"]
-        if workflow_status == "FAIL":
+        if phases["end_to_end_workflow"]["workflow_status"] == "FAIL":
             recommendations.append(
                 "Fix end-to-end workflow - validate agent sequence and success criteria"
             )
         
         # Overall recommendations
-        overall_status = results["overall_summary"]["overall_status"]
-        if overall_status == "PASS":
+        if results["overall_summary"]["overall_status"] == "PASS":
             recommendations.append(
                 "🎉 DS Agent Framework integration tests PASSED! Ready for production use."
             )
@@ -474,8 +567,13 @@ class ComprehensiveIntegrationTest:
     
     def save_results(self, results: Dict[str, Any], output_file: Path) -> None:
         """Save test results to file."""
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        if orjson:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2, default=str))
+        else:
+            # Raw UTF-8 like orjson, so both paths write the same report
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, default=str, ensure_ascii=False)
         
         self.logger.info(f"Test results saved to: {output_file}")
 
@@ -488,6 +586,8 @@ def main():
     parser.add_argument("--generate-report", action="store_true", help="Generate detailed test report")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
     parser.add_argument("--output-dir", type=Path, default="results", help="Output directory for results")
+    parser.add_argument("--no-cache", action="store_true", help="Recompute cached error detection results")
+    parser.add_argument("--jobs", type=int, default=1, help="Run full-suite test phases in N worker threads")
     
     args = parser.parse_args()
     
@@ -497,16 +597,16 @@ def main():
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Initialize comprehensive test runner
-    test_runner = ComprehensiveIntegrationTest(test_dir, verbose=args.verbose)
+    test_runner = ComprehensiveIntegrationTest(test_dir, verbose=args.verbose, use_cache=not args.no_cache)
     
     # Execute tests based on arguments
     if args.full_suite:
-        results = test_runner.run_full_test_suite()
+        results = test_runner.run_full_test_suite(jobs=args.jobs)
     elif args.quick_check:
         results = test_runner.run_framework_structure_validation()
     else:
         # Default to full suite
-        results = test_runner.run_full_test_suite()
+        results = test_runner.run_full_test_suite(jobs=args.jobs)
     
     # Generate report if requested
     if args.generate_report:
@@ -514,28 +614,29 @@ def main():
         report_file = output_dir / f"integration_test_report_{timestamp}.json"
         test_runner.save_results(results, report_file)
         
-        # Print summary to console
+        # Build the console summary in memory and write it in one call
+        out = io.StringIO()
         if "overall_summary" in results:
             summary = results["overall_summary"]
-            print(f"\n{'='*60}")
-            print(f"DS AGENT FRAMEWORK INTEGRATION TEST SUMMARY")
-            print(f"{'='*60}")
-            print(f"Overall Status: {summary['overall_status']}")
-            print(f"Phase Pass Rate: {summary['phase_pass_rate']:.1%}")
-            print(f"Duration: {results.get('duration_seconds', 0):.1f}s")
+            print(f"\n{'='*60}", file=out)
+            print(f"DS AGENT FRAMEWORK INTEGRATION TEST SUMMARY", file=out)
+            print(f"{'='*60}", file=out)
+            print(f"Overall Status: {summary['overall_status']}", file=out)
+            print(f"Phase Pass Rate: {summary['phase_pass_rate']:.1%}", file=out)
+            print(f"Duration: {results.get('duration_seconds', 0):.1f}s", file=out)
             
-            print(f"\nPhase Results:")
+            print(f"\nPhase Results:", file=out)
             for phase, status in summary["phase_results"].items():
                 status_icon = "✅" if status == "PASS" else "❌"
-                print(f"  {status_icon} {phase}: {status}")
+                print(f"  {status_icon} {phase}: {status}", file=out)
             
             if "recommendations" in results:
-                print(f"\nRecommendations:")
+                print(f"\nRecommendations:", file=out)
                 for rec in results["recommendations"]:
-                    print(f"  • {rec}")
+                    print(f"  • {rec}", file=out)
         
-        print(f"\nDetailed report: {report_file}")
-
+        print(f"\nDetailed report: {report_file}", file=out)
+        sys.stdout.write(out.getvalue())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
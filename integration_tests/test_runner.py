@@ -12,6 +12,7 @@ by simulating a realistic churn prediction project and checking that:
 Usage:
     python test_runner.py --scenario churn_prediction --verbose
     python test_runner.py --all-scenarios --generate-report
+    python test_runner.py --all-scenarios --workers 4
 """
 
 import argparse
@@ -19,14 +20,22 @@ import json
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 import pytest
 from dataclasses import dataclass, asdict
 
 
+@lru_cache(maxsize=4096)
+def _exists(path: str) -> bool:
+    """Cached ``Path.exists``; cleared at the start of every test run."""
+    return Path(path).exists()
+
+
 @dataclass
 class TestResult:
     """Test execution result."""
@@ -72,9 +81,16 @@ class DSAgentIntegrationTest:
         
         return logger
     
-    def run_all_tests(self) -> Dict[str, TestResult]:
-        """Run complete integration test suite."""
+    def run_all_tests(self, workers: int = 1) -> Dict[str, TestResult]:
+        """Run complete integration test suite.
+        
+        The scenarios are independent; with ``workers > 1`` they run
+        concurrently in that many worker threads. Results are still recorded
+        in scenario order (log lines may interleave).
+        """
         self.logger.info("Starting DS Agent Framework Integration Tests")
+        # Reruns in the same process must see the current filesystem
+        _exists.cache_clear()
         
         # Test scenarios in dependency order
         test_scenarios = [
@@ -89,36 +105,42 @@ class DSAgentIntegrationTest:
             ("end_to_end_workflow", self.test_end_to_end_workflow)
         ]
         
-        for test_name, test_func in test_scenarios:
-            try:
-                self.logger.info(f"Running test: {test_name}")
-                start_time = datetime.now()
-                
-                result = test_func()
-                
-                duration = (datetime.now() - start_time).total_seconds()
-                test_result = TestResult(
-                    test_name=test_name,
-                    status="PASS" if result else "FAIL", 
-                    duration_seconds=duration,
-                    details=f"Test completed in {duration:.2f}s"
-                )
-                
-            except Exception as e:
-                duration = (datetime.now() - start_time).total_seconds()
-                test_result = TestResult(
-                    test_name=test_name,
-                    status="FAIL",
-                    duration_seconds=duration,
-                    errors=[str(e)],
-                    details=f"Test failed with exception: {e}"
-                )
-                self.logger.error(f"Test {test_name} failed: {e}")
-            
-            self.results.append(test_result)
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(test_scenarios))) as executor:
+                futures = [executor.submit(self._run_test, name, func) for name, func in test_scenarios]
+                self.results.extend(future.result() for future in futures)
+        else:
+            self.results.extend(self._run_test(name, func) for name, func in test_scenarios)
             
         return {r.test_name: r for r in self.results}
     
+    def _run_test(self, test_name: str, test_func: Callable[[], bool]) -> TestResult:
+        """Run a single test scenario and wrap its outcome in a TestResult."""
+        start_time = datetime.now()
+        try:
+            self.logger.info(f"Running test: {test_name}")
+            
+            result = test_func()
+            
+            duration = (datetime.now() - start_time).total_seconds()
+            return TestResult(
+                test_name=test_name,
+                status="PASS" if result else "FAIL", 
+                duration_seconds=duration,
+                details=f"Test completed in {duration:.2f}s"
+            )
+            
+        except Exception as e:
+            duration = (datetime.now() - start_time).total_seconds()
+            self.logger.error(f"Test {test_name} failed: {e}")
+            return TestResult(
+                test_name=test_name,
+                status="FAIL",
+                duration_seconds=duration,
+                errors=[str(e)],
+                details=f"Test failed with exception: {e}"
+            )
+    
     def test_router_decomposition(self) -> bool:
         """Test head-of-ds-router problem decomposition abilities."""
         self.logger.debug("Testing router decomposition...")
@@ -159,7 +181,7 @@ class DSAgentIntegrationTest:
         
         # Check if ds-planning-workflows skill exists
         skill_path = self.test_dir / ".github/skills/ds-planning-workflows"
-        if not skill_path.exists():
+        if not _exists(str(skill_path)):
             self.logger.error("DS planning workflows skill not found")
             return False
             
@@ -173,7 +195,7 @@ class DSAgentIntegrationTest:
         ]
         
         for req_file in required_files:
-            if not (skill_path / req_file).exists():
+            if not _exists(str(skill_path / req_file)):
                 self.logger.error(f"Required skill file missing: {req_file}")
                 return False
                 
@@ -422,7 +444,7 @@ class DSAgentIntegrationTest:
         """Validate agent specialization and DS concerns."""
         # In real implementation, this would check agent capabilities
         agent_file = Path(f".github/agents/{agent}.agent.md")
-        if not agent_file.exists():
+        if not _exists(str(agent_file)):
             self.logger.error(f"Agent file not found: {agent_file}")
             return False
             
@@ -518,6 +540,7 @@ def main():
     parser.add_argument("--all-scenarios", action="store_true", help="Run all test scenarios")
     parser.add_argument("--generate-report", action="store_true", help="Generate detailed test report")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
+    parser.add_argument("--workers", type=int, default=1, help="Run test scenarios in N worker threads")
     parser.add_argument("--output-dir", type=Path, default="results", help="Output directory for results")
     
     args = parser.parse_args()
@@ -532,7 +555,7 @@ def main():
     
     # Execute tests
     if args.all_scenarios or not args.scenario:
-        test_results = test_runner.run_all_tests()
+        test_results = test_runner.run_all_tests(workers=args.workers)
     else:
         # Run specific scenario (not implemented in this example)
         print(f"Running scenario: {args.scenario}")
@@ -15,6 +15,7 @@ Each test scenario can be run independently or as part of the full suite.
 import json
 import pytest
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
@@ -51,9 +52,14 @@ class WorkflowTest:
 
 
 class DSAgentTestScenarios:
-    """Container for all DS agent test scenarios."""
+    """Container for all DS agent test scenarios.
+    
+    Each scenario set is built on first use and the same objects are
+    returned afterwards; callers should treat them as read-only.
+    """
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_churn_prediction_workflow() -> WorkflowTest:
         """Complete churn prediction workflow test."""
         return WorkflowTest(
@@ -107,6 +113,7 @@ class DSAgentTestScenarios:
         )
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_router_decomposition_tests() -> List[MockAgentResponse]:
         """Test scenarios for head-of-ds-router decomposition."""
         return [
@@ -158,6 +165,7 @@ class DSAgentTestScenarios:
         ]
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_data_engineer_tests() -> List[MockAgentResponse]:
         """Test scenarios for data-engineer specialist."""
         return [
@@ -213,6 +221,7 @@ class DSAgentTestScenarios:
         ]
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_data_scientist_tests() -> List[MockAgentResponse]:
         """Test scenarios for data-scientist specialist."""
         return [
@@ -265,6 +274,7 @@ class DSAgentTestScenarios:
         ]
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_ml_engineer_tests() -> List[MockAgentResponse]:
         """Test scenarios for ml-engineer specialist."""
         return [
@@ -317,6 +327,7 @@ class DSAgentTestScenarios:
         ]
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_ds_validator_error_scenarios() -> List[ValidationScenario]:
         """Error scenarios for ds-validator testing."""
         return [
@@ -404,6 +415,7 @@ class DSAgentTestScenarios:
         ]
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_collaboration_test_scenarios() -> List[Dict[str, Any]]:
         """Test scenarios for agent collaboration and handoffs."""
         return [
@@ -458,6 +470,7 @@ class DSAgentTestScenarios:
         ]
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_error_recovery_scenarios() -> List[Dict[str, Any]]:
         """Scenarios testing error detection and recovery workflows."""
         return [
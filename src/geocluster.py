@@ -9,41 +9,57 @@ Two clustering approaches:
 2. Diameter: Max pairwise distance within cluster ≤ D
 """
 
+import math
 import numpy as np
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 from sklearn.neighbors import BallTree
 
+try:
+    from numba import njit, prange
+except ImportError:  # optional: fused parallel distance kernel
+    njit = None
 
-def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+# Bounds within which the equirectangular approximation stays within ~0.1%
+# of the great-circle distance: the latitude span in degrees, and the
+# meridian convergence ``radians(lon span) * sin(max |lat|)`` in radians
+LOCAL_MAX_LAT_SPAN = 5.0
+LOCAL_MAX_MERIDIAN_CONVERGENCE = 0.08
+
+
+def haversine_distance(lat1, lon1, lat2, lon2):
     """
     Calculate the great circle distance between two points on Earth.
     
-    Uses the Haversine formula to compute distance in kilometers.
+    Uses the Haversine formula to compute distance in kilometers. Inputs may
+    be scalars or array-likes that broadcast together, e.g.
+    ``haversine_distance(lat[:, None], lon[:, None], lat[None, :], lon[None, :])``
+    gives the full pairwise matrix in one vectorized call.
     
     Parameters
     ----------
-    lat1, lon1 : float
-        Latitude and longitude of first point in decimal degrees
-    lat2, lon2 : float
-        Latitude and longitude of second point in decimal degrees
+    lat1, lon1 : float or array_like
+        Latitude and longitude of first point(s) in decimal degrees
+    lat2, lon2 : float or array_like
+        Latitude and longitude of second point(s) in decimal degrees
         
     Returns
     -------
-    float
-        Distance in kilometers
+    float or np.ndarray
+        Distance(s) in kilometers, with the broadcast shape of the inputs
         
     References
     ----------
     Haversine formula: https://en.wikipedia.org/wiki/Haversine_formula
     """
-    # Earth radius in kilometers
-    R = 6371.0
+    # Earth radius in kilometers; a float32 scalar keeps float32 inputs in
+    # float32 (float64 inputs still promote to float64)
+    R = np.float32(6371.0)
     
     # Convert decimal degrees to radians
-    lat1_rad = np.radians(lat1)
-    lon1_rad = np.radians(lon1)
-    lat2_rad = np.radians(lat2)
-    lon2_rad = np.radians(lon2)
+    lat1_rad = np.radians(np.asarray(lat1))
+    lon1_rad = np.radians(np.asarray(lon1))
+    lat2_rad = np.radians(np.asarray(lat2))
+    lon2_rad = np.radians(np.asarray(lon2))
     
     # Haversine formula
     dlat = lat2_rad - lat1_rad
@@ -56,43 +72,176 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return distance
 
 
-def haversine_distance_matrix(points: np.ndarray) -> np.ndarray:
+def haversine_distance_local(lat1, lon1, lat2, lon2, cos_lat0=None):
+    """
+    Approximate the great circle distance for nearby points.
+    
+    Uses the equirectangular projection
+    ``R * sqrt(dlat**2 + (cos(lat0) * dlon)**2)``, which needs no trig per
+    pair. It is accurate to ~0.1% while the points stay within
+    `LOCAL_MAX_LAT_SPAN` and `LOCAL_MAX_MERIDIAN_CONVERGENCE`; the error
+    grows with the longitude span and towards the poles. Inputs broadcast
+    like `haversine_distance`.
+    
+    Parameters
+    ----------
+    lat1, lon1 : float or array_like
+        Latitude and longitude of first point(s) in decimal degrees
+    lat2, lon2 : float or array_like
+        Latitude and longitude of second point(s) in decimal degrees
+    cos_lat0 : float or array_like, optional
+        Cosine of the reference latitude, broadcasting with the inputs;
+        defaults to that of each pair's mid-latitude, which callers can
+        precompute to skip the per-pair cosine
+        
+    Returns
+    -------
+    float or np.ndarray
+        Approximate distance(s) in kilometers
+    """
+    R = np.float32(6371.0)
+    
+    lat1 = np.asarray(lat1)
+    lat2 = np.asarray(lat2)
+    if cos_lat0 is None:
+        cos_lat0 = np.cos(np.radians((lat1 + lat2) / 2))
+    
+    x = np.radians(np.asarray(lon2) - np.asarray(lon1)) * cos_lat0
+    y = np.radians(lat2 - lat1)
+    return R * np.hypot(x, y)
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def pairwise_haversine_nb(lats, lons, out):
+        """Fill ``out`` with pairwise Haversine distances in kilometers.
+        
+        Rows run in parallel and every pair is computed in registers, so no
+        (n, n) temporaries are allocated beyond ``out`` itself. Only pairs
+        with i < j are evaluated; each is mirrored across the zero diagonal.
+        """
+        n = lats.shape[0]
+        deg = math.pi / 180.0
+        for i in prange(n):
+            lat_i = lats[i] * deg
+            lon_i = lons[i] * deg
+            cos_lat_i = math.cos(lat_i)
+            out[i, i] = 0.0
+            for j in range(i + 1, n):
+                lat_j = lats[j] * deg
+                sin_half_dlat = math.sin((lat_j - lat_i) / 2)
+                sin_half_dlon = math.sin((lons[j] * deg - lon_i) / 2)
+                a = sin_half_dlat**2 + cos_lat_i * math.cos(lat_j) * sin_half_dlon**2
+                d = 6371.0 * 2 * math.asin(math.sqrt(a))
+                out[i, j] = d
+                out[j, i] = d
+
+
+def _local_approximation_ok(lat: np.ndarray, lon: np.ndarray) -> bool:
+    """Whether the points are compact enough for `haversine_distance_local`."""
+    if np.ptp(lat) > LOCAL_MAX_LAT_SPAN:
+        return False
+    convergence = np.radians(np.ptp(lon)) * np.sin(np.radians(np.max(np.abs(lat))))
+    return convergence <= LOCAL_MAX_MERIDIAN_CONVERGENCE
+
+
+def haversine_distance_matrix(
+    points,
+    local: bool = False
+) -> np.ndarray:
     """
     Compute pairwise Haversine distances for all points.
     
     Parameters
     ----------
-    points : np.ndarray
-        Array of shape (n_points, 2) with columns [lat, lon]
+    points : np.ndarray or tuple of np.ndarray
+        Array of shape (n_points, 2) with columns [lat, lon], or a
+        ``(lats, lons)`` pair of 1-D arrays. The pair form is read with unit
+        stride instead of gathering every other element.
+    local : bool
+        Use `haversine_distance_local` at each pair's mid-latitude. Ignored
+        (exact distances are returned) when the points span more than
+        `LOCAL_MAX_LAT_SPAN` degrees of latitude, or when their longitude
+        span times ``sin(max |lat|)`` exceeds `LOCAL_MAX_MERIDIAN_CONVERGENCE`.
         
     Returns
     -------
     np.ndarray
         Distance matrix of shape (n_points, n_points)
     """
-    n = len(points)
-    distances = np.zeros((n, n))
-    
-    for i in range(n):
-        for j in range(i+1, n):
-            dist = haversine_distance(
-                points[i, 0], points[i, 1],
-                points[j, 0], points[j, 1]
-            )
-            distances[i, j] = dist
-            distances[j, i] = dist
-            
-    return distances
+    if isinstance(points, tuple):
+        lat, lon = (np.asarray(coords) for coords in points)
+    else:
+        lat = points[:, 0]
+        lon = points[:, 1]
+    n_points = len(lat)
+    local = local and n_points > 0 and _local_approximation_ok(lat, lon)
+    
+    if njit is not None and not local:
+        out = np.empty((n_points, n_points), dtype=np.result_type(lat.dtype, lon.dtype, np.float32))
+        pairwise_haversine_nb(np.ascontiguousarray(lat), np.ascontiguousarray(lon), out)
+        return out
+    
+    # The matrix is symmetric with a zero diagonal: evaluate the i < j pairs
+    # in one vectorized call and mirror them
+    rows, cols = np.triu_indices(n_points, k=1)
+    if local:
+        # cos of each pair's mid-latitude from per-point half-angle terms,
+        # so no trig is evaluated per pair
+        half_lat = np.radians(lat) / 2
+        cos_half, sin_half = np.cos(half_lat), np.sin(half_lat)
+        cos_mid = cos_half[rows] * cos_half[cols] - sin_half[rows] * sin_half[cols]
+        pair_dists = haversine_distance_local(lat[rows], lon[rows], lat[cols], lon[cols], cos_mid)
+    else:
+        pair_dists = haversine_distance(lat[rows], lon[rows], lat[cols], lon[cols])
+    
+    dist_matrix = np.zeros((n_points, n_points), dtype=pair_dists.dtype)
+    dist_matrix[rows, cols] = pair_dists
+    dist_matrix[cols, rows] = pair_dists
+    return dist_matrix
+
+
+def groups_by_label(
+    cluster_labels: np.ndarray,
+    n_clusters: Optional[int] = None
+) -> List[np.ndarray]:
+    """
+    Group point indices by cluster label.
+    
+    One stable argsort plus a searchsorted over the label boundaries replaces
+    a full ``labels == k`` scan per cluster.
+    
+    Parameters
+    ----------
+    cluster_labels : np.ndarray
+        Cluster assignments (0 to k-1); other labels are ignored
+    n_clusters : int, optional
+        Number of clusters; defaults to ``max(label) + 1``
+        
+    Returns
+    -------
+    List[np.ndarray]
+        For each cluster, the indices of its points in original order
+    """
+    labels = np.asarray(cluster_labels)
+    if n_clusters is None:
+        n_clusters = int(labels.max()) + 1 if labels.size else 0
+    
+    order = np.argsort(labels, kind='stable')
+    splits = np.searchsorted(labels[order], np.arange(n_clusters + 1))
+    return [order[splits[k]:splits[k + 1]] for k in range(n_clusters)]
 
 
 def cluster_by_center_radius(
     points: np.ndarray, 
-    D: float
+    D: float,
+    distances: Optional[np.ndarray] = None
 ) -> Tuple[np.ndarray, np.ndarray, int]:
     """
     Cluster points where max distance from center to any point ≤ D.
     
-    Uses greedy farthest-first algorithm with BallTree for efficiency.
+    Uses greedy farthest-first algorithm with a single BallTree built
+    up front, so each new center costs one O(log n + k) radius query.
     Guarantees that every point in a cluster is within distance D from
     the cluster center.
     
@@ -110,6 +259,9 @@ def cluster_by_center_radius(
         Array of shape (n_points, 2) with columns [lat, lon] in decimal degrees
     D : float
         Maximum radius in kilometers
+    distances : np.ndarray, optional
+        Precomputed pairwise distance matrix from `haversine_distance_matrix`.
+        When given, radius queries read it instead of building BallTrees.
         
     Returns
     -------
@@ -130,8 +282,11 @@ def cluster_by_center_radius(
     cluster_centers_list = []
     current_cluster = 0
     
-    # Convert points to radians for BallTree (expects lat, lon in radians)
-    points_rad = np.radians(points)
+    if distances is None:
+        # One BallTree over all points (expects lat, lon in radians); hits
+        # that are already clustered are filtered out after each query
+        points_rad = np.radians(points)
+        tree = BallTree(points_rad, metric='haversine')
     
     while np.any(cluster_labels == -1):
         # Find first unclustered point as new center
@@ -143,18 +298,21 @@ def cluster_by_center_radius(
         center_point = points[center_idx]
         cluster_centers_list.append(center_point)
         
-        # Build BallTree with unclustered points for efficient radius query
-        unclustered_points_rad = points_rad[unclustered_mask]
-        tree = BallTree(unclustered_points_rad, metric='haversine')
+        if distances is not None:
+            # Radius query straight from the precomputed matrix
+            within = distances[center_idx, unclustered_indices] <= D
+            cluster_labels[unclustered_indices[within]] = current_cluster
+            current_cluster += 1
+            continue
         
         # Query points within radius D (convert to radians for haversine)
         # haversine metric in BallTree uses unit sphere, multiply by Earth radius
         center_rad = points_rad[center_idx:center_idx+1]
         indices = tree.query_radius(center_rad, r=D/6371.0)[0]
         
-        # Map back to original indices
-        original_indices = unclustered_indices[indices]
-        cluster_labels[original_indices] = current_cluster
+        # Keep only the hits that are still unclustered
+        indices = indices[cluster_labels[indices] == -1]
+        cluster_labels[indices] = current_cluster
         
         current_cluster += 1
     
@@ -164,7 +322,8 @@ def cluster_by_center_radius(
 
 def cluster_by_diameter(
     points: np.ndarray, 
-    D: float
+    D: float,
+    distances: Optional[np.ndarray] = None
 ) -> Tuple[np.ndarray, np.ndarray, int]:
     """
     Cluster points where max pairwise distance within cluster ≤ D.
@@ -186,6 +345,9 @@ def cluster_by_diameter(
         Array of shape (n_points, 2) with columns [lat, lon] in decimal degrees
     D : float
         Maximum diameter (pairwise distance) in kilometers
+    distances : np.ndarray, optional
+        Precomputed pairwise distance matrix from `haversine_distance_matrix`;
+        computed here when omitted
         
     Returns
     -------
@@ -206,8 +368,8 @@ def cluster_by_diameter(
     cluster_centers_list = []
     current_cluster = 0
     
-    # Precompute distance matrix for efficiency
-    dist_matrix = haversine_distance_matrix(points)
+    # Precompute distance matrix for efficiency (unless the caller has one)
+    dist_matrix = distances if distances is not None else haversine_distance_matrix(points)
     
     while np.any(cluster_labels == -1):
         # Find first unclustered point to start new cluster
@@ -219,16 +381,24 @@ def cluster_by_diameter(
         cluster_points = [seed_idx]
         cluster_labels[seed_idx] = current_cluster
         
+        # Running max distance from every remaining point to the cluster;
+        # only points within D of the seed can ever join
+        candidates = unclustered_indices[1:]
+        max_dist_to_cluster = dist_matrix[candidates, seed_idx]
+        reachable = max_dist_to_cluster <= D
+        candidates = candidates[reachable]
+        max_dist_to_cluster = max_dist_to_cluster[reachable]
+        
         # Try to add more points to this cluster
-        for candidate_idx in unclustered_indices[1:]:
+        for k, candidate_idx in enumerate(candidates):
             # Check if adding this point violates diameter constraint
-            max_dist_to_cluster = max(
-                dist_matrix[candidate_idx, pt_idx] for pt_idx in cluster_points
-            )
-            
-            if max_dist_to_cluster <= D:
+            if max_dist_to_cluster[k] <= D:
                 cluster_points.append(candidate_idx)
                 cluster_labels[candidate_idx] = current_cluster
+                np.maximum(
+                    max_dist_to_cluster, dist_matrix[candidates, candidate_idx],
+                    out=max_dist_to_cluster
+                )
         
         # Compute cluster centroid (mean position)
         cluster_coords = points[cluster_points]
@@ -275,22 +445,21 @@ def validate_center_radius_constraint(
     """
     violations = []
     
-    for cluster_id in range(len(cluster_centers)):
-        cluster_mask = cluster_labels == cluster_id
-        cluster_points = points[cluster_mask]
+    groups = groups_by_label(cluster_labels, len(cluster_centers))
+    for cluster_id, members in enumerate(groups):
+        cluster_points = points[members]
         center = cluster_centers[cluster_id]
         
-        for i, point in enumerate(cluster_points):
-            dist = haversine_distance(
-                point[0], point[1],
-                center[0], center[1]
+        dists = haversine_distance(
+            cluster_points[:, 0], cluster_points[:, 1],
+            center[0], center[1]
+        )
+        
+        for i in np.flatnonzero(dists > D + tolerance):
+            violations.append(
+                f"Cluster {cluster_id}, point {i}: "
+                f"distance {dists[i]:.3f} km > D={D} km"
             )
-            
-            if dist > D + tolerance:
-                violations.append(
-                    f"Cluster {cluster_id}, point {i}: "
-                    f"distance {dist:.3f} km > D={D} km"
-                )
     
     return len(violations) == 0, violations
 
@@ -299,7 +468,8 @@ def validate_diameter_constraint(
     points: np.ndarray,
     cluster_labels: np.ndarray,
     D: float,
-    tolerance: float = 1e-6
+    tolerance: float = 1e-6,
+    distances: Optional[np.ndarray] = None
 ) -> Tuple[bool, List[str]]:
     """
     Validate that diameter constraint is satisfied.
@@ -316,6 +486,9 @@ def validate_diameter_constraint(
         Maximum diameter in kilometers
     tolerance : float
         Numerical tolerance for constraint checking
+    distances : np.ndarray, optional
+        Precomputed pairwise distance matrix over all points; each cluster's
+        block is sliced from it instead of being recomputed
         
     Returns
     -------
@@ -327,24 +500,23 @@ def validate_diameter_constraint(
     violations = []
     n_clusters = len(np.unique(cluster_labels))
     
-    for cluster_id in range(n_clusters):
-        cluster_mask = cluster_labels == cluster_id
-        cluster_points = points[cluster_mask]
+    groups = groups_by_label(cluster_labels, n_clusters)
+    for cluster_id, members in enumerate(groups):
+        cluster_points = points[members]
         
-        # Check all pairwise distances
-        n = len(cluster_points)
-        for i in range(n):
-            for j in range(i+1, n):
-                dist = haversine_distance(
-                    cluster_points[i, 0], cluster_points[i, 1],
-                    cluster_points[j, 0], cluster_points[j, 1]
-                )
-                
-                if dist > D + tolerance:
-                    violations.append(
-                        f"Cluster {cluster_id}, points {i}-{j}: "
-                        f"distance {dist:.3f} km > D={D} km"
-                    )
+        # Check all pairwise distances (upper triangle, row by row)
+        if distances is not None:
+            dists = distances[np.ix_(members, members)]
+        else:
+            dists = haversine_distance_matrix(cluster_points)
+        rows, cols = np.triu_indices(len(cluster_points), k=1)
+        pair_dists = dists[rows, cols]
+        
+        for k in np.flatnonzero(pair_dists > D + tolerance):
+            violations.append(
+                f"Cluster {cluster_id}, points {rows[k]}-{cols[k]}: "
+                f"distance {pair_dists[k]:.3f} km > D={D} km"
+            )
     
     return len(violations) == 0, violations
 
@@ -376,30 +548,22 @@ def compute_cluster_statistics(
     max_radii = []
     max_diameters = []
     
-    for cluster_id in range(n_clusters):
-        cluster_mask = cluster_labels == cluster_id
-        cluster_points = points[cluster_mask]
+    groups = groups_by_label(cluster_labels, n_clusters)
+    for cluster_id, members in enumerate(groups):
+        cluster_points = points[members]
         cluster_sizes.append(len(cluster_points))
         
         # Compute max radius (distance from center)
         center = cluster_centers[cluster_id]
-        radii = [
-            haversine_distance(pt[0], pt[1], center[0], center[1])
-            for pt in cluster_points
-        ]
-        max_radii.append(max(radii) if radii else 0.0)
+        radii = haversine_distance(
+            cluster_points[:, 0], cluster_points[:, 1],
+            center[0], center[1]
+        )
+        max_radii.append(radii.max() if radii.size else 0.0)
         
         # Compute max diameter (max pairwise distance)
         n = len(cluster_points)
-        diameters = []
-        for i in range(n):
-            for j in range(i+1, n):
-                dist = haversine_distance(
-                    cluster_points[i, 0], cluster_points[i, 1],
-                    cluster_points[j, 0], cluster_points[j, 1]
-                )
-                diameters.append(dist)
-        max_diameters.append(max(diameters) if diameters else 0.0)
+        max_diameters.append(haversine_distance_matrix(cluster_points).max() if n > 1 else 0.0)
     
     return {
         'n_clusters': n_clusters,
@@ -0,0 +1,60 @@
+"""
+Unit tests for the DS planning leakage risk checker.
+
+Tests cover:
+- Minimum gap vs prediction horizon parsing
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / ".github/skills/ds-planning-workflows/scripts/check_leakage_risks.py"
+_spec = importlib.util.spec_from_file_location("check_leakage_risks", SCRIPT)
+check_leakage_risks = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(check_leakage_risks)
+LeakageRiskChecker = check_leakage_risks.LeakageRiskChecker
+
+
+def _plan(min_gap, prediction_horizon):
+    return {
+        'evaluation_protocol': {
+            'temporal_validation': {
+                'minimum_gap': min_gap,
+                'prediction_horizon': prediction_horizon
+            }
+        }
+    }
+
+
+class TestTemporalValidation:
+    """Test the minimum gap vs prediction horizon check."""
+    
+    @pytest.mark.parametrize("min_gap,horizon", [
+        ("30 days", "60 days"),
+        ("30-day", "60-day"),
+        ("30-day gap", "60 day horizon"),
+        ("30 business days", "60 calendar days"),
+        ("30 Days", "60-day"),
+    ])
+    def test_gap_shorter_than_horizon_warns(self, min_gap, horizon):
+        """A gap shorter than the horizon is flagged, with or without a hyphen."""
+        risks, warnings = LeakageRiskChecker.check_temporal_validation(_plan(min_gap, horizon))
+        
+        assert risks == []
+        assert [w.issue for w in warnings] == [
+            'Minimum gap (30d) shorter than prediction horizon (60d)'
+        ]
+    
+    def test_gap_covering_horizon_passes(self):
+        """No warning when the gap is at least as long as the horizon."""
+        _, warnings = LeakageRiskChecker.check_temporal_validation(_plan("90-day", "60-day"))
+        
+        assert warnings == []
+    
+    def test_non_day_units_skipped(self):
+        """Only day-denominated durations are compared."""
+        _, warnings = LeakageRiskChecker.check_temporal_validation(_plan("1 week", "60 days"))
+        
+        assert warnings == []
@@ -13,11 +13,16 @@ import pytest
 import numpy as np
 from src.geocluster import (
     haversine_distance,
+    haversine_distance_local,
+    haversine_distance_matrix,
     cluster_by_center_radius,
     cluster_by_diameter,
     validate_center_radius_constraint,
     validate_diameter_constraint,
-    compute_cluster_statistics
+    compute_cluster_statistics,
+    groups_by_label,
+    LOCAL_MAX_LAT_SPAN,
+    LOCAL_MAX_MERIDIAN_CONVERGENCE
 )
 
 
@@ -69,6 +74,79 @@ class TestHaversineDistance:
         
         dist = haversine_distance(lat1, lon1, lat2, lon2)
         assert 1.0 < dist < 2.0  # Should be around 1.4 km
+    
+    def test_broadcast_matches_scalar(self):
+        """Array inputs broadcast to a pairwise matrix matching scalar calls."""
+        lats = np.array([37.7749, 34.0522, 40.7128])
+        lons = np.array([-122.4194, -118.2437, -74.0060])
+        
+        matrix = haversine_distance(lats[:, None], lons[:, None], lats[None, :], lons[None, :])
+        
+        assert matrix.shape == (3, 3)
+        for i in range(3):
+            for j in range(3):
+                assert matrix[i, j] == pytest.approx(
+                    haversine_distance(lats[i], lons[i], lats[j], lons[j])
+                )
+
+    
+    def test_matrix_from_lat_lon_arrays(self):
+        """A (lats, lons) pair gives the same matrix as stacked points."""
+        points = np.array([[37.7749, -122.4194], [34.0522, -118.2437], [40.7128, -74.0060]])
+        
+        matrix = haversine_distance_matrix((points[:, 0].copy(), points[:, 1].copy()))
+        
+        assert np.array_equal(matrix, haversine_distance_matrix(points))
+    
+    def test_local_approximation_close_to_exact(self):
+        """Equirectangular distances stay within 0.1% for a metro area."""
+        np.random.seed(0)
+        points = np.random.uniform(low=[37.2, -122.6], high=[38.0, -121.8], size=(50, 2))
+        
+        exact = haversine_distance_matrix(points)
+        approx = haversine_distance_matrix(points, local=True)
+        
+        assert approx == pytest.approx(exact, rel=1e-3, abs=1e-9)
+        assert haversine_distance_local(37.7749, -122.4194, 37.3382, -121.8863) == pytest.approx(
+            haversine_distance(37.7749, -122.4194, 37.3382, -121.8863), rel=1e-3
+        )
+    
+    def test_local_falls_back_for_wide_span(self):
+        """Points spanning more than a few degrees use exact distances."""
+        points = np.array([[40.7128, -74.0060], [51.5074, -0.1278], [34.0522, -118.2437]])
+        
+        assert np.array_equal(
+            haversine_distance_matrix(points, local=True),
+            haversine_distance_matrix(points)
+        )
+    
+    @pytest.mark.parametrize("lat0", [-60.0, 0.0, 40.0, 60.0, 80.0])
+    def test_local_error_bound_at_guard_edge(self, lat0):
+        """A grid right at both local-approximation limits stays within 0.1%."""
+        max_abs_lat = max(abs(lat0), abs(lat0 + LOCAL_MAX_LAT_SPAN))
+        # Just inside the convergence limit (rounding could push it over)
+        lon_span = 0.999 * np.degrees(LOCAL_MAX_MERIDIAN_CONVERGENCE / np.sin(np.radians(max_abs_lat)))
+        lon_span = min(lon_span, 30.0)
+        grid = np.linspace(0.0, 1.0, 15)
+        lats = np.repeat(lat0 + LOCAL_MAX_LAT_SPAN * grid, len(grid))
+        lons = np.tile(10.0 + lon_span * grid, len(grid))
+        
+        exact = haversine_distance(lats[:, None], lons[:, None], lats[None, :], lons[None, :])
+        approx = haversine_distance_matrix((lats, lons), local=True)
+        
+        assert not np.array_equal(approx, haversine_distance_matrix((lats, lons)))
+        assert approx == pytest.approx(exact, rel=1e-3, abs=1e-9)
+    
+    @pytest.mark.parametrize("lat_range,lon_span", [((60.0, 64.0), 20.0), ((40.0, 44.0), 40.0)])
+    def test_local_falls_back_for_wide_longitude_span(self, lat_range, lon_span):
+        """A narrow latitude band with a wide longitude span uses exact distances."""
+        lats = np.array([lat_range[0], lat_range[0], lat_range[1], lat_range[1]])
+        lons = np.array([0.0, lon_span, 0.0, lon_span])
+        
+        assert np.array_equal(
+            haversine_distance_matrix((lats, lons), local=True),
+            haversine_distance_matrix((lats, lons))
+        )
 
 
 class TestClusterByCenterRadius:
@@ -143,6 +221,20 @@ class TestClusterByCenterRadius:
         
         # Should form 1 or 2 clusters depending on numerical precision
         assert 1 <= n_clusters <= 2
+    
+    def test_precomputed_distances_match(self):
+        """Passing the distance matrix gives the same clustering."""
+        np.random.seed(42)
+        points = np.random.uniform(low=[37.0, -123.0], high=[38.0, -122.0], size=(50, 2))
+        D = 30.0
+        
+        labels, _, n_clusters = cluster_by_center_radius(points, D)
+        labels_pre, _, n_clusters_pre = cluster_by_center_radius(
+            points, D, distances=haversine_distance_matrix(points)
+        )
+        
+        assert n_clusters_pre == n_clusters
+        assert np.array_equal(labels_pre, labels)
 
 
 class TestClusterByDiameter:
@@ -293,6 +385,24 @@ class TestConstraintValidation:
         
         assert not is_valid
         assert len(violations) > 0
+    
+    def test_diameter_validation_with_precomputed_distances(self):
+        """Sliced precomputed distances report the same violations."""
+        points = np.array([
+            [37.7749, -122.4194],
+            [38.7749, -122.4194],  # ~111 km north
+            [37.7849, -122.4094],
+        ])
+        labels = np.array([0, 0, 1])
+        D = 50.0
+        
+        expected = validate_diameter_constraint(points, labels, D)
+        result = validate_diameter_constraint(
+            points, labels, D, distances=haversine_distance_matrix(points)
+        )
+        
+        assert result == expected
+        assert not result[0]
 
 
 class TestClusterStatistics:
@@ -319,6 +429,24 @@ class TestClusterStatistics:
         assert 'max_diameter_overall' in stats
 
 
+class TestGroupsByLabel:
+    """Test grouping point indices by cluster label."""
+    
+    def test_groups_preserve_point_order(self):
+        """Each group lists its points' indices in original order."""
+        labels = np.array([1, 0, 1, 2, 0, 1])
+        
+        groups = groups_by_label(labels)
+        
+        assert [g.tolist() for g in groups] == [[1, 4], [0, 2, 5], [3]]
+    
+    def test_empty_cluster(self):
+        """Clusters without points yield empty index arrays."""
+        groups = groups_by_label(np.array([0, 0, 2]), n_clusters=4)
+        
+        assert [g.tolist() for g in groups] == [[0, 1], [], [2], []]
+
+
 class TestAlgorithmPerformance:
     """Test algorithm performance on larger datasets."""
     